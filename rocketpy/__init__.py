@@ -55,3 +55,4 @@ from .stochastic import (
     StochasticTail,
     StochasticTrapezoidalFins,
 )
+from .tools import suppress_info
@@ -1,6 +1,7 @@
 from inspect import signature
 
 from ..prints.controller_prints import _ControllerPrints
+from ..tools import skip_if_info_suppressed
 
 
 class _Controller:
@@ -174,10 +175,12 @@ class _Controller:
     def __str__(self):
         return f"Controller '{self.name}' with sampling rate {self.sampling_rate} Hz."
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints out summarized information about the controller."""
         self.prints.all()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out all information about the controller."""
         self.info()
@@ -43,6 +43,7 @@ from rocketpy.prints.environment_prints import _EnvironmentPrints
 from rocketpy.tools import (
     bilinear_interpolation,
     geopotential_height_to_geometric_height,
+    skip_if_info_suppressed,
 )
 
 
@@ -2436,11 +2437,13 @@ class Environment:
             extrapolation="constant",
         )
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints important data and graphs available about the Environment."""
         self.prints.all()
         self.plots.info()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out all data and graphs available about the Environment."""
         self.prints.all()
@@ -19,6 +19,7 @@ from ..tools import (
     geopotential_to_height_agl,
     geopotential_to_height_asl,
     import_optional_dependency,
+    skip_if_info_suppressed,
     time_num_to_date_string,
 )
 from ..units import convert_units
@@ -2749,6 +2750,7 @@ class EnvironmentAnalysis:  # pylint: disable=too-many-public-methods
 
     # Plots
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints out the most important data and graphs available about the
         Environment Analysis.
@@ -2761,6 +2763,7 @@ class EnvironmentAnalysis:  # pylint: disable=too-many-public-methods
         self.prints.all()
         self.plots.info()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out all data and graphs available.
 
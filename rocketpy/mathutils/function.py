@@ -45,6 +45,49 @@ INTERPOLATION_TYPES = {
 }
 EXTRAPOLATION_TYPES = {"zero": 0, "natural": 1, "constant": 2}
 
+# Numba is an optional dependency. When installed, the 1-D interpolation
+# kernels below are compiled to machine code, otherwise the pure Python
+# interpolation functions defined in Function are used.
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+
+def _linear_eval(x, x_data, y_data):
+    """Evaluates the linear interpolation of (x_data, y_data) at x, which must
+    lie inside the x_data range. Written to be compiled by numba."""
+    x_interval = np.searchsorted(x_data, x)
+    x_left = x_data[x_interval - 1]
+    y_left = y_data[x_interval - 1]
+    dx = x_data[x_interval] - x_left
+    dy = y_data[x_interval] - y_left
+    return (x - x_left) * (dy / dx) + y_left
+
+
+def _spline_eval(x, x_data, coeffs):
+    """Evaluates the natural cubic spline or akima interpolation at x, which
+    must lie inside the x_data range, given the (n - 1, 4) array with the
+    local polynomial coefficients of each interval in its rows. Written to be
+    compiled by numba."""
+    x_interval = max(np.searchsorted(x_data, x), 1)
+    x = x - x_data[x_interval - 1]
+    a = coeffs[x_interval - 1]
+    return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
+
+
+if njit is not None:
+    _linear_eval = njit(cache=True)(_linear_eval)
+    _spline_eval = njit(cache=True)(_spline_eval)
+
+
+def _to_numpy_scalar(value):
+    """Converts the builtin scalars returned by the numba kernels back to the
+    numpy scalar types returned by the pure Python interpolation functions."""
+    if isinstance(value, complex):
+        return np.complex128(value)
+    return np.float64(value)
+
 
 class Function:  # pylint: disable=too-many-public-methods
     """Class converts a python function or a data sequence into an object
@@ -319,10 +362,11 @@ class Function:  # pylint: disable=too-many-public-methods
             self._coeffs = self.__polynomial_coefficients__
         elif method == "akima":
             self.__interpolate_akima__()
-            self._coeffs = self.__akima_coefficients__
+            # One contiguous row of local coefficients per interval
+            self._coeffs = np.ascontiguousarray(self.__akima_coefficients__.T)
         elif method == "spline" or method is None:
             self.__interpolate_spline__()
-            self._coeffs = self.__spline_coefficients__
+            self._coeffs = np.ascontiguousarray(self.__spline_coefficients__.T)
         else:
             self._coeffs = []
 
@@ -358,7 +402,12 @@ class Function:  # pylint: disable=too-many-public-methods
         The function is stored in the attribute _interpolation_func."""
         interpolation = INTERPOLATION_TYPES[self.__interpolation__]
         if interpolation == 0:  # linear
-            if self.__dom_dim__ == 1:
+            if self.__dom_dim__ == 1 and njit is not None:
+
+                def linear_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
+                    return _to_numpy_scalar(_linear_eval(x, x_data, y_data))
+
+            elif self.__dom_dim__ == 1:
 
                 def linear_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
                     x_interval = bisect_left(x_data, x)
@@ -384,23 +433,35 @@ class Function:  # pylint: disable=too-many-public-methods
             self._interpolation_func = polynomial_interpolation
 
         elif interpolation == 2:  # akima
+            if njit is not None:
 
-            def akima_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
-                x_interval = bisect_left(x_data, x)
-                x_interval = x_interval if x_interval != 0 else 1
-                a = coeffs[4 * x_interval - 4 : 4 * x_interval]
-                return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
+                def akima_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
+                    return _to_numpy_scalar(_spline_eval(x, x_data, coeffs))
+
+            else:
+
+                def akima_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
+                    x_interval = max(bisect_left(x_data, x) - 1, 0)
+                    a_0, a_1, a_2, a_3 = coeffs[x_interval].tolist()
+                    x = x - x_data[x_interval]
+                    return ((a_3 * x + a_2) * x + a_1) * x + a_0
 
             self._interpolation_func = akima_interpolation
 
         elif interpolation == 3:  # spline
+            if njit is not None:
+
+                def spline_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
+                    return _to_numpy_scalar(_spline_eval(x, x_data, coeffs))
+
+            else:
 
-            def spline_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
-                x_interval = bisect_left(x_data, x)
-                x_interval = max(x_interval, 1)
-                a = coeffs[:, x_interval - 1]
-                x = x - x_data[x_interval - 1]
-                return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
+                def spline_interpolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
+                    x_interval = bisect_left(x_data, x)
+                    x_interval = max(x_interval, 1)
+                    a = coeffs[x_interval - 1]
+                    x = x - x_data[x_interval - 1]
+                    return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
 
             self._interpolation_func = spline_interpolation
 
@@ -474,20 +535,14 @@ class Function:  # pylint: disable=too-many-public-methods
                 def natural_extrapolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
                     return np.sum(coeffs * x ** np.arange(len(coeffs)))
 
-            elif interpolation == 2:  # akima
-
-                def natural_extrapolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
-                    a = coeffs[:4] if x < x_min else coeffs[-4:]
-                    return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
-
-            elif interpolation == 3:  # spline
+            elif interpolation in (2, 3):  # akima or spline
 
                 def natural_extrapolation(x, x_min, x_max, x_data, y_data, coeffs):  # pylint: disable=unused-argument
                     if x < x_min:
-                        a = coeffs[:, 0]
+                        a = coeffs[0]
                         x = x - x_data[0]
                     else:
-                        a = coeffs[:, -1]
+                        a = coeffs[-1]
                         x = x - x_data[-2]
                     return a[3] * x**3 + a[2] * x**2 + a[1] * x + a[0]
 
@@ -1879,34 +1934,25 @@ class Function:  # pylint: disable=too-many-public-methods
         self.__spline_coefficients__ = np.vstack([y[:-1], b, c[:-1], d])
 
     def __interpolate_akima__(self):
-        """Calculate akima spline coefficients that fit the data exactly"""
-        # Get x and y values for all supplied points
+        """Calculate akima spline coefficients that fit the data exactly. The
+        coefficients are stored as a (4, n - 1) array, in the same local form
+        used by the spline coefficients, i.e. polynomials of (x - x_i)."""
         x, y = self.x_array, self.y_array
+        dx = np.diff(x)
+        slopes = np.diff(y) / dx
         # Estimate derivatives at each point
-        d = [0] * len(x)
-        d[0] = (y[1] - y[0]) / (x[1] - x[0])
-        d[-1] = (y[-1] - y[-2]) / (x[-1] - x[-2])
-        for i in range(1, len(x) - 1):
-            w1, w2 = (x[i] - x[i - 1]), (x[i + 1] - x[i])
-            d1, d2 = ((y[i] - y[i - 1]) / w1), ((y[i + 1] - y[i]) / w2)
-            d[i] = (w1 * d2 + w2 * d1) / (w1 + w2)
-        # Calculate coefficients for each interval with system already solved
-        coeffs = [0] * 4 * (len(x) - 1)
-        for i in range(len(x) - 1):
-            xl, xr = x[i], x[i + 1]
-            yl, yr = y[i], y[i + 1]
-            dl, dr = d[i], d[i + 1]
-            matrix = np.array(
-                [
-                    [1, xl, xl**2, xl**3],
-                    [1, xr, xr**2, xr**3],
-                    [0, 1, 2 * xl, 3 * xl**2],
-                    [0, 1, 2 * xr, 3 * xr**2],
-                ]
-            )
-            result = np.array([yl, yr, dl, dr]).T
-            coeffs[4 * i : 4 * i + 4] = np.linalg.solve(matrix, result)
-        self.__akima_coefficients__ = coeffs
+        d = np.empty_like(x)
+        d[0], d[-1] = slopes[0], slopes[-1]
+        d[1:-1] = (dx[1:] * slopes[:-1] + dx[:-1] * slopes[1:]) / (dx[:-1] + dx[1:])
+        # Cubic Hermite coefficients of each interval
+        self.__akima_coefficients__ = np.vstack(
+            [
+                y[:-1],
+                d[:-1],
+                (3 * slopes - 2 * d[:-1] - d[1:]) / dx,
+                (d[:-1] + d[1:] - 2 * slopes) / dx**2,
+            ]
+        )
 
     def __neg__(self):
         """Negates the Function object. The result has the same effect as
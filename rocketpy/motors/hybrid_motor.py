@@ -2,7 +2,7 @@ from functools import cached_property
 
 from rocketpy.tools import parallel_axis_theorem_from_com
 
-from ..mathutils.function import Function, funcify_method, reset_funcified_methods
+from ..mathutils.function import Function, funcify_method
 from ..plots.hybrid_motor_plots import _HybridMotorPlots
 from ..prints.hybrid_motor_prints import _HybridMotorPrints
 from .liquid_motor import LiquidMotor
@@ -358,9 +358,15 @@ class HybridMotor(Motor):
         self.grains_center_of_mass_position = grains_center_of_mass_position
         self.throat_radius = throat_radius
 
-        # Initialize plots and prints object
-        self.prints = _HybridMotorPrints(self)
-        self.plots = _HybridMotorPlots(self)
+    @cached_property
+    def prints(self):
+        """Prints object of the motor. It is only created on first access."""
+        return _HybridMotorPrints(self)
+
+    @cached_property
+    def plots(self):
+        """Plots object of the motor. It is only created on first access."""
+        return _HybridMotorPlots(self)
 
     @funcify_method("Time (s)", "Exhaust velocity (m/s)")
     def exhaust_velocity(self):
@@ -599,7 +605,7 @@ class HybridMotor(Motor):
         self.solid.mass_flow_rate = (
             self.total_mass_flow_rate - self.liquid.mass_flow_rate
         )
-        reset_funcified_methods(self)
+        self._reset_propellant_caches()
 
     def draw(self, *, filename=None):
         """Draws a representation of the HybridMotor.
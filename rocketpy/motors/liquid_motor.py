@@ -2,7 +2,7 @@ from functools import cached_property
 
 import numpy as np
 
-from rocketpy.mathutils.function import funcify_method, reset_funcified_methods
+from rocketpy.mathutils.function import funcify_method
 from rocketpy.tools import parallel_axis_theorem_from_com
 
 from ..plots.liquid_motor_plots import _LiquidMotorPlots
@@ -246,9 +246,15 @@ class LiquidMotor(Motor):
 
         self.positioned_tanks = []
 
-        # Initialize plots and prints object
-        self.prints = _LiquidMotorPrints(self)
-        self.plots = _LiquidMotorPlots(self)
+    @cached_property
+    def prints(self):
+        """Prints object of the motor. It is only created on first access."""
+        return _LiquidMotorPrints(self)
+
+    @cached_property
+    def plots(self):
+        """Plots object of the motor. It is only created on first access."""
+        return _LiquidMotorPlots(self)
 
     @funcify_method("Time (s)", "Exhaust Velocity (m/s)")
     def exhaust_velocity(self):
@@ -461,7 +467,7 @@ class LiquidMotor(Motor):
         :ref:`Adding Tanks`
         """
         self.positioned_tanks.append({"tank": tank, "position": position})
-        reset_funcified_methods(self)
+        self._reset_propellant_caches()
 
     def draw(self, *, filename=None):
         """Draw a representation of the LiquidMotor.
@@ -1,15 +1,106 @@
-import re
 import warnings
 from abc import ABC, abstractmethod
-from functools import cached_property
-from os import path
+from functools import cached_property, lru_cache
+from os import path, stat
 
 import numpy as np
 
-from ..mathutils.function import Function, funcify_method
+from ..mathutils.function import Function, funcify_method, reset_funcified_methods
 from ..plots.motor_plots import _MotorPlots
 from ..prints.motor_prints import _MotorPrints
-from ..tools import parallel_axis_theorem_from_com, tuple_handler
+from ..tools import (
+    parallel_axis_theorem_from_com,
+    skip_if_info_suppressed,
+    tuple_handler,
+)
+
+# Numba is an optional dependency, used to compile the trapezoidal sum below
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover
+    njit = None
+
+
+def _trapz_sum(xs, ys):
+    """Trapezoidal integral of the points (xs, ys) over their whole range."""
+    return np.dot(np.diff(xs), ys[1:] + ys[:-1]) / 2
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _trapz_sum(xs, ys):  # pylint: disable=function-redefined
+        """Trapezoidal integral of the points (xs, ys) over their whole range,
+        computed in a single compiled loop without temporary arrays."""
+        total = 0.0
+        for i in range(xs.shape[0] - 1):
+            total += (xs[i + 1] - xs[i]) * (ys[i + 1] + ys[i])
+        return total / 2
+
+
+def _trapz_range(xs, ys, a, b):
+    """Integrates the piecewise linear curve defined by the points (xs, ys)
+    from a to b in a single vectorized trapezoidal pass. The curve is
+    considered to be zero outside the [xs[0], xs[-1]] interval.
+
+    Parameters
+    ----------
+    xs : np.ndarray
+        Sorted abscissas of the curve.
+    ys : np.ndarray
+        Ordinates of the curve.
+    a : float
+        Lower limit of integration.
+    b : float
+        Upper limit of integration. Must be greater than or equal to a.
+
+    Returns
+    -------
+    float
+        Integral of the curve from a to b.
+    """
+    a, b = max(a, xs[0]), min(b, xs[-1])
+    if b <= a:
+        return 0.0
+    i0 = np.searchsorted(xs, a, side="right")
+    i1 = np.searchsorted(xs, b, side="left")
+    y_a, y_b = np.interp((a, b), xs, ys)
+    if i1 <= i0:
+        return (b - a) * (y_a + y_b) / 2
+    # Inner points in one pass, partial segments at the limits analytically
+    return (
+        _trapz_sum(xs[i0:i1], ys[i0:i1])
+        + (xs[i0] - a) * (y_a + ys[i0]) / 2
+        + (b - xs[i1 - 1]) * (ys[i1 - 1] + y_b) / 2
+    )
+
+
+def _shared_time_grid(*functions):
+    """Returns the common time grid of Functions defined by arrays of points
+    sampled at the exact same instants, or None if there is no such grid.
+    Arithmetic between such Functions may be fused into a single NumPy
+    expression on their y arrays, with the same result as the equivalent
+    Function operations.
+
+    Parameters
+    ----------
+    *functions : Function
+        One dimensional Functions to be checked.
+
+    Returns
+    -------
+    np.ndarray or None
+        Time grid shared by all Functions.
+    """
+    time = None
+    for func in functions:
+        if not isinstance(func, Function) or not isinstance(func.source, np.ndarray):
+            return None
+        if time is None:
+            time = func.x_array
+        elif func.x_array is not time and not np.array_equal(func.x_array, time):
+            return None
+    return time
 
 
 # pylint: disable=too-many-public-methods
@@ -278,11 +369,13 @@ class Motor(ABC):
                 _, self.description_eng_file, points = Motor.import_eng(thrust_source)
                 thrust_source = points
 
-        # Evaluate raw thrust source
+        # Evaluate raw thrust source. The burn_time setter falls back to its
+        # time range, the final curve is only assigned after being processed
         self.thrust_source = thrust_source
-        self.thrust = Function(
+        thrust = Function(
             thrust_source, "Time (s)", "Thrust (N)", self.interpolate, "zero"
         )
+        self.thrust = thrust
 
         # Handle dry_mass input
         self.dry_mass = dry_mass
@@ -290,36 +383,60 @@ class Motor(ABC):
         # Handle burn_time input
         self.burn_time = burn_time
 
-        if callable(self.thrust.source):
-            self.thrust.set_discrete(*self.burn_time, 50, self.interpolate, "zero")
+        # Constant thrust value, known analytically unless it gets reshaped
+        self._constant_thrust = (
+            float(thrust_source)
+            if isinstance(thrust_source, (int, float)) and not reshape_thrust_curve
+            else None
+        )
+
+        if callable(thrust.source):
+            # Sample the callable directly instead of going through set_discrete
+            time_array = np.linspace(*self.burn_time, 50)
+            if self._constant_thrust is not None:
+                thrust_array = np.full(50, self._constant_thrust)
+            else:
+                thrust_array = np.asarray(
+                    [thrust.source(t) for t in time_array], dtype=np.float64
+                )
+            thrust = Function(
+                np.column_stack((time_array, thrust_array)),
+                "Time (s)",
+                "Thrust (N)",
+                self.interpolate,
+                "zero",
+            )
 
         # Reshape thrust_source if needed
         if reshape_thrust_curve:
             # Overwrites burn_time and thrust
-            self.thrust = Motor.reshape_thrust_curve(self.thrust, *reshape_thrust_curve)
-            self.burn_time = (self.thrust.x_array[0], self.thrust.x_array[-1])
+            thrust = Motor.reshape_thrust_curve(thrust, *reshape_thrust_curve)
+            self.burn_time = (thrust.x_array[0], thrust.x_array[-1])
 
         # Post process thrust
-        self.thrust = Motor.clip_thrust(self.thrust, self.burn_time)
+        thrust = Motor.clip_thrust(thrust, self.burn_time)
+        self.thrust = thrust
 
         # Auxiliary quantities
         self.burn_start_time = self.burn_time[0]
         self.burn_out_time = self.burn_time[1]
         self.burn_duration = self.burn_time[1] - self.burn_time[0]
 
-        # Define motor attributes
-        self.nozzle_radius = nozzle_radius
-        self.nozzle_position = nozzle_position
-
         # Compute thrust metrics
-        self.max_thrust = np.amax(self.thrust.y_array)
         max_thrust_index = np.argmax(self.thrust.y_array)
+        self.max_thrust = self.thrust.source[max_thrust_index, 1]
         self.max_thrust_time = self.thrust.source[max_thrust_index, 0]
         self.average_thrust = self.total_impulse / self.burn_duration
 
-        # Initialize plots and prints object
-        self.prints = _MotorPrints(self)
-        self.plots = _MotorPlots(self)
+    @cached_property
+    def prints(self):
+        """Prints object of the motor. It is only created on first access."""
+        return _MotorPrints(self)
+
+    @cached_property
+    def plots(self):
+        """Plots object of the motor. It is only created on first access."""
+        return _MotorPlots(self)
 
     @property
     def burn_time(self):
@@ -394,7 +511,44 @@ class Motor(ABC):
         self.total_impulse : float
             Motor total impulse in Ns.
         """
-        return self.thrust.integral(*self.burn_time)
+        start, end = self.burn_time
+        if self._constant_thrust is not None:
+            return self._constant_thrust * (end - start)
+        thrust = self.thrust
+        is_linear = (
+            isinstance(thrust.source, np.ndarray)
+            and thrust.__interpolation__ == "linear"
+        )
+        if is_linear and (
+            thrust.__extrapolation__ == "zero"
+            or thrust.x_array[0] <= start <= end <= thrust.x_array[-1]
+        ):
+            return _trapz_range(thrust.x_array, thrust.y_array, start, end)
+        return thrust.integral(start, end)
+
+    @cached_property
+    def _average_exhaust_velocity(self):
+        """Average exhaust velocity of the motor gases, defined as the ratio of
+        the total impulse and the propellant initial mass. It is cached so that
+        the thrust integration is not repeated on every access.
+
+        Returns
+        -------
+        float
+            Average exhaust velocity in m/s.
+        """
+        return self.total_impulse / self.propellant_initial_mass
+
+    def _reset_propellant_caches(self):
+        """Resets the funcified methods and the cached propellant values, such
+        as ``propellant_initial_mass`` and ``_average_exhaust_velocity``, so
+        that they are computed again after the propellant changes. Values
+        that are plain instance attributes, such as the
+        ``GenericMotor.propellant_initial_mass``, are kept."""
+        reset_funcified_methods(self)
+        for name in ("propellant_initial_mass", "_average_exhaust_velocity"):
+            if isinstance(getattr(type(self), name, None), cached_property):
+                self.__dict__.pop(name, None)
 
     @property
     @abstractmethod
@@ -485,8 +639,7 @@ class Motor(ABC):
         rate should not be greater than `total_mass_flow_rate`, otherwise the
         grains mass flow rate will be negative, losing physical meaning.
         """
-        average_exhaust_velocity = self.total_impulse / self.propellant_initial_mass
-        return self.thrust / -average_exhaust_velocity
+        return self.thrust / -self._average_exhaust_velocity
 
     @property
     @abstractmethod
@@ -497,6 +650,15 @@ class Motor(ABC):
         -------
         float
             Propellant initial mass in kg.
+
+        Notes
+        -----
+        This value is read by several derived quantities, such as the
+        ``total_mass_flow_rate`` and the ``structural_mass_ratio``. Child
+        classes whose evaluation is expensive (e.g. integrals or Function
+        evaluations) should cache it, so that every access after the first
+        one is O(1). ``SolidMotor``, ``LiquidMotor`` and ``HybridMotor``
+        implement it as a ``cached_property``.
         """
 
     @property
@@ -510,12 +672,9 @@ class Motor(ABC):
             Initial structural mass ratio.
         """
         initial_total_mass = self.dry_mass + self.propellant_initial_mass
-        try:
-            return self.dry_mass / initial_total_mass
-        except ZeroDivisionError as e:
-            raise ValueError(
-                "Total motor mass (dry + propellant) cannot be zero"
-            ) from e
+        if initial_total_mass == 0:
+            raise ValueError("Total motor mass (dry + propellant) cannot be zero")
+        return self.dry_mass / initial_total_mass
 
     @funcify_method("Time (s)", "Motor center of mass (m)")
     def center_of_mass(self):
@@ -527,6 +686,21 @@ class Motor(ABC):
         Function
             Position of the center of mass as a function of time.
         """
+        center_of_propellant_mass = self.center_of_propellant_mass
+        propellant_mass = self.propellant_mass
+        time = _shared_time_grid(center_of_propellant_mass, propellant_mass)
+        if time is not None and center_of_propellant_mass.__dom_dim__ == 1:
+            # Fused version of the Function arithmetic below
+            mass = propellant_mass.y_array
+            center_of_mass = (
+                center_of_propellant_mass.y_array * mass
+                + self.dry_mass * self.center_of_dry_mass_position
+            ) / (mass + self.dry_mass)
+            return Function(
+                np.column_stack((time, center_of_mass)),
+                interpolation=center_of_propellant_mass.__interpolation__,
+                extrapolation=center_of_propellant_mass.__extrapolation__,
+            )
         mass_balance = (
             self.center_of_propellant_mass * self.propellant_mass
             + self.dry_mass * self.center_of_dry_mass_position
@@ -569,6 +743,28 @@ class Motor(ABC):
         prop_I_11 = self.propellant_I_11
         dry_I_11 = self.dry_I_11
 
+        time = _shared_time_grid(
+            prop_I_11,
+            self.propellant_mass,
+            self.center_of_propellant_mass,
+            self.center_of_mass,
+        )
+        if time is not None and prop_I_11.__dom_dim__ == 1:
+            # Fused version of the Steiner terms below
+            center_of_mass = self.center_of_mass.y_array
+            prop_to_cm = self.center_of_propellant_mass.y_array - center_of_mass
+            dry_to_cm = self.center_of_dry_mass_position - center_of_mass
+            inertia = (
+                prop_I_11.y_array
+                + self.propellant_mass.y_array * (prop_to_cm * prop_to_cm)
+                + (dry_I_11 + self.dry_mass * (dry_to_cm * dry_to_cm))
+            )
+            return Function(
+                np.column_stack((time, inertia)),
+                interpolation=prop_I_11.__interpolation__,
+                extrapolation=prop_I_11.__extrapolation__,
+            )
+
         prop_to_cm = self.center_of_propellant_mass - self.center_of_mass
         dry_to_cm = self.center_of_dry_mass_position - self.center_of_mass
 
@@ -910,22 +1106,23 @@ class Motor(ABC):
         ) * time_array
         # Adjust origin
         new_time_array = new_time_array - new_time_array[0] + new_burn_time[0]
-        source = np.column_stack((new_time_array, thrust_array))
-        thrust = Function(
-            source, "Time (s)", "Thrust (N)", thrust.__interpolation__, "zero"
-        )
+        interpolation = thrust.__interpolation__
 
-        # Get old total impulse
-        old_total_impulse = thrust.integral(*new_burn_time)
+        # Get old total impulse. The new time array spans the whole burn, so
+        # a linear curve is integrated exactly by a single trapezoidal sum
+        if interpolation == "linear":
+            old_total_impulse = _trapz_sum(new_time_array, thrust_array)
+        else:
+            old_total_impulse = Function(
+                np.column_stack((new_time_array, thrust_array)),
+                interpolation=interpolation,
+                extrapolation="zero",
+            ).integral(*new_burn_time)
 
         # Compute new thrust values
         new_thrust_array = (total_impulse / old_total_impulse) * thrust_array
         source = np.column_stack((new_time_array, new_thrust_array))
-        thrust = Function(
-            source, "Time (s)", "Thrust (N)", thrust.__interpolation__, "zero"
-        )
-
-        return thrust
+        return Function(source, "Time (s)", "Thrust (N)", interpolation, "zero")
 
     @staticmethod
     def clip_thrust(thrust, new_burn_time):
@@ -945,18 +1142,22 @@ class Motor(ABC):
         Returns
         -------
         Function
-            Clipped thrust curve.
+            Clipped thrust curve. If the burn_time range covers the whole
+            thrust dataset, it holds a copy of the thrust data points.
         """
+        x_array, y_array = thrust.x_array, thrust.y_array
+        first_time, last_time = x_array[0], x_array[-1]
+
         # Check if burn_time is within thrust_source range
         changed_burn_time = False
         burn_time = list(tuple_handler(new_burn_time))
 
-        if burn_time[1] > thrust.x_array[-1]:
-            burn_time[1] = thrust.x_array[-1]
+        if burn_time[1] > last_time:
+            burn_time[1] = last_time
             changed_burn_time = True
 
-        if burn_time[0] < thrust.x_array[0]:
-            burn_time[0] = thrust.x_array[0]
+        if burn_time[0] < first_time:
+            burn_time[0] = first_time
             changed_burn_time = True
 
         if changed_burn_time:
@@ -969,18 +1170,35 @@ class Motor(ABC):
                 "curve please use the 'reshape_thrust_curve' argument."
             )
 
-        # Clip thrust input according to burn_time
-        bound_mask = np.logical_and(
-            thrust.x_array > burn_time[0],
-            thrust.x_array < burn_time[1],
-        )
-        clipped_source = thrust.source[bound_mask]
+        # Nothing to clip when the burn_time spans the whole thrust data, the
+        # source is copied so that the caller's array is not shared
+        if burn_time[0] == first_time and burn_time[1] == last_time:
+            return Function(
+                thrust.source.copy(),
+                "Time (s)",
+                "Thrust (N)",
+                thrust.__interpolation__,
+                "zero",
+            )
+
+        # Clip thrust input according to burn_time: keep points strictly
+        # inside the burn_time range, which is a contiguous slice of the data
+        start_index = np.searchsorted(x_array, burn_time[0], side="right")
+        end_index = np.searchsorted(x_array, burn_time[1], side="left")
 
-        # Update source with burn_time points
-        end_burn_data = [(burn_time[1], thrust(burn_time[1]))]
-        clipped_source = np.append(clipped_source, end_burn_data, 0)
-        start_burn_data = [(burn_time[0], thrust(burn_time[0]))]
-        clipped_source = np.insert(clipped_source, 0, start_burn_data, 0)
+        # Thrust at the burn_time boundaries, which lie inside the data range,
+        # so the interpolation is evaluated without the __call__ dispatch
+        if thrust.__interpolation__ == "linear":
+            start_thrust, end_thrust = np.interp(burn_time, x_array, y_array)
+        else:
+            start_thrust = thrust.get_value_opt(burn_time[0])
+            end_thrust = thrust.get_value_opt(burn_time[1])
+
+        # Update source with burn_time points, filling a single buffer
+        clipped_source = np.empty((end_index - start_index + 2, 2))
+        clipped_source[0] = burn_time[0], start_thrust
+        clipped_source[1:-1] = thrust.source[start_index:end_index]
+        clipped_source[-1] = burn_time[1], end_thrust
 
         return Function(
             clipped_source,
@@ -1018,23 +1236,37 @@ class Motor(ABC):
         # Initialize arrays
         comments = []
         description = []
-        data_points = [[0, 0]]
 
-        # Open and read .eng file
         with open(file_name) as file:
+            # Stream the header line by line until the description is found
             for line in file:
-                if re.search(r";.*", line):
+                line, separator, comment = line.rstrip("\n").partition(";")
+                if separator:
                     # Extract comment
-                    comments.append(re.findall(r";.*", line)[0])
-                    line = re.sub(r";.*", "", line)
-                if line.strip():
-                    if not description:
-                        # Extract description
-                        description = line.strip().split(" ")
-                    else:
-                        # Extract thrust curve data points
-                        time, thrust = re.findall(r"[-+]?\d*\.\d+|[-+]?\d+", line)
-                        data_points.append([float(time), float(thrust)])
+                    comments.append(separator + comment)
+                line = line.strip()
+                if line:
+                    # Extract description
+                    description = line.split(" ")
+                    break
+
+            # The remaining lines only hold the thrust curve data points
+            data = file.read()
+
+        # Comments are rare after the description, only look for them if any
+        data_lines = data.splitlines()
+        if ";" in data:
+            comments.extend(
+                line[line.index(";") :] for line in data_lines if ";" in line
+            )
+
+        # Extract thrust curve data points in a single call to NumPy's parser
+        data_points = [[0, 0]]
+        if data.strip():
+            data = np.loadtxt(
+                data_lines, comments=";", usecols=(0, 1), ndmin=2, dtype=np.float64
+            )
+            data_points += data.tolist()
 
         # Return all extract content
         return comments, description, data_points
@@ -1056,46 +1288,40 @@ class Motor(ABC):
         -------
         None
         """
-        # Open file
-        with open(file_name, "w") as file:
-            # Write first line
-            def get_attr_value(obj, attr_name, multiplier=1):
-                return multiplier * getattr(obj, attr_name, 0)
-
-            grain_outer_radius = get_attr_value(self, "grain_outer_radius", 2000)
-            grain_number = get_attr_value(self, "grain_number", 1000)
-            grain_initial_height = get_attr_value(self, "grain_initial_height")
-            grain_separation = get_attr_value(self, "grain_separation")
+        # First line. Only solid grains define the grain attributes
+        grain_outer_radius = 2000 * getattr(self, "grain_outer_radius", 0)
+        grain_number = 1000 * getattr(self, "grain_number", 0)
+        grain_initial_height = getattr(self, "grain_initial_height", 0)
+        grain_separation = getattr(self, "grain_separation", 0)
 
-            grain_total = grain_number * (grain_initial_height + grain_separation)
+        grain_total = grain_number * (grain_initial_height + grain_separation)
 
-            if grain_outer_radius == 0 or grain_total == 0:
-                warnings.warn(
-                    "The motor object doesn't have some grain-related attributes. "
-                    "Using zeros to write to file."
-                )
-
-            file.write(
-                f"{motor_name} {grain_outer_radius:3.1f} {grain_total:3.1f} 0 "
-                f"{self.propellant_initial_mass:2.3} "
-                f"{self.propellant_initial_mass:2.3} RocketPy\n"
+        if grain_outer_radius == 0 or grain_total == 0:
+            warnings.warn(
+                "The motor object doesn't have some grain-related attributes. "
+                "Using zeros to write to file."
             )
 
-            # Write thrust curve data points
-            for time, thrust in self.thrust.source[1:-1, :]:
-                file.write(f"{time:.4f} {thrust:.3f}\n")
+        header = (
+            f"{motor_name} {grain_outer_radius:3.1f} {grain_total:3.1f} 0 "
+            f"{self.propellant_initial_mass:2.3} "
+            f"{self.propellant_initial_mass:2.3} RocketPy\n"
+        )
 
-            # Write last line
-            file.write(f"{self.thrust.source[-1, 0]:.4f} {0:.3f}\n")
+        # Thrust curve data points, formatted from builtin floats
+        data_points = "".join(
+            f"{time:.4f} {thrust:.3f}\n"
+            for time, thrust in self.thrust.source[1:-1, :].tolist()
+        )
 
-    def to_dict(self, include_outputs=False):
-        thrust_source = self.thrust_source
+        # Last line
+        last_line = f"{self.thrust.source[-1, 0]:.4f} {0:.3f}\n"
 
-        if isinstance(thrust_source, str):
-            thrust_source = self.thrust.source
-        elif callable(thrust_source) and not isinstance(thrust_source, Function):
-            thrust_source = Function(thrust_source)
+        # Write the whole file at once
+        with open(file_name, "w") as file:
+            file.write(header + data_points + last_line)
 
+    def to_dict(self, include_outputs=False):
         data = {
             "thrust_source": self.thrust,
             "dry_I_11": self.dry_I_11,
@@ -1142,6 +1368,7 @@ class Motor(ABC):
 
         return data
 
+    @skip_if_info_suppressed
     def info(self, *, filename=None):
         """Prints out a summary of the data and graphs available about the
         Motor.
@@ -1162,12 +1389,36 @@ class Motor(ABC):
         self.prints.all()
         self.plots.thrust(filename=filename)
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out all data and graphs available about the Motor."""
         self.prints.all()
         self.plots.all()
 
 
+@lru_cache(maxsize=32)
+def _import_eng_cached(file_name, modification_time, size):
+    """Cached version of ``Motor.import_eng``, used by
+    ``GenericMotor.load_from_eng_file``. The modification time and size of
+    the file are part of the cache key, so edited files are parsed again.
+    At most 32 files are kept, and ``_import_eng_cached.cache_clear()``
+    empties the cache. The data points are returned as a read only array,
+    which ``load_from_eng_file`` copies for each motor.
+
+    Returns
+    -------
+    description : tuple
+        Description of the motor, as returned by ``Motor.import_eng``.
+    data_points : np.ndarray
+        Read only array of the thrust curve data points.
+    """
+    # pylint: disable=unused-argument
+    _, description, data_points = Motor.import_eng(file_name)
+    data_points = np.array(data_points, dtype=np.float64)
+    data_points.flags.writeable = False
+    return tuple(description), data_points
+
+
 # TODO: move this class to a separate file, needs a breaking change warning
 class GenericMotor(Motor):
     """Class that represents a simple motor defined mainly by its thrust curve.
@@ -1306,20 +1557,10 @@ class GenericMotor(Motor):
             if center_of_dry_mass_position
             else chamber_position
         )
-        # Initialize plots and prints object
-        self.prints = _MotorPrints(self)
-        self.plots = _MotorPlots(self)
-
-    @cached_property
-    def propellant_initial_mass(self):
-        """Calculates the initial mass of the propellant.
 
-        Returns
-        -------
-        float
-            Initial mass of the propellant.
-        """
-        return self.propellant_initial_mass
+    # Plain instance attribute assigned in __init__. The class level value
+    # implements the abstract Motor.propellant_initial_mass property
+    propellant_initial_mass = None
 
     @funcify_method("Time (s)", "Exhaust velocity (m/s)")
     def exhaust_velocity(self):
@@ -1331,17 +1572,26 @@ class GenericMotor(Motor):
         self.exhaust_velocity : Function
             Gas exhaust velocity of the motor.
         """
-        return Function(
-            self.total_impulse / self.propellant_initial_mass
-        ).set_discrete_based_on_model(self.thrust)
+        return self._average_exhaust_velocity
 
     @funcify_method("Time (s)", "Mass Flow Rate (kg/s)")
     def mass_flow_rate(self):
         """Time derivative of propellant mass. Assumes constant exhaust
         velocity. The formula used is the opposite of thrust divided by
         exhaust velocity.
+
+        Returns
+        -------
+        Function
+            Time derivative of total propellant mass as a function of time.
+
+        See Also
+        --------
+        Motor.total_mass_flow_rate :
+            Calculates the total mass flow rate of the motor assuming
+            constant exhaust velocity.
         """
-        return -1 * self.thrust / self.exhaust_velocity
+        return self.thrust / -self._average_exhaust_velocity
 
     @funcify_method("Time (s)", "center of mass (m)")
     def center_of_propellant_mass(self):
@@ -1376,11 +1626,9 @@ class GenericMotor(Motor):
         ----------
         https://en.wikipedia.org/wiki/Moment_of_inertia#Inertia_tensor
         """
-        return (
-            self.propellant_mass
-            * (3 * self.chamber_radius**2 + self.chamber_height**2)
-            / 12
-        )
+        # Geometric factor folded into a scalar, for a single Function product
+        shape_factor = (3 * self.chamber_radius**2 + self.chamber_height**2) / 12
+        return self.propellant_mass * shape_factor
 
     @funcify_method("Time (s)", "Inertia I_22 (kg m²)")
     def propellant_I_22(self):
@@ -1424,19 +1672,20 @@ class GenericMotor(Motor):
         ----------
         https://en.wikipedia.org/wiki/Moment_of_inertia#Inertia_tensor
         """
-        return self.propellant_mass * self.chamber_radius**2 / 2
+        shape_factor = self.chamber_radius**2 / 2
+        return self.propellant_mass * shape_factor
 
     @funcify_method("Time (s)", "Inertia I_12 (kg m²)")
     def propellant_I_12(self):
-        return Function(0)
+        return 0
 
     @funcify_method("Time (s)", "Inertia I_13 (kg m²)")
     def propellant_I_13(self):
-        return Function(0)
+        return 0
 
     @funcify_method("Time (s)", "Inertia I_23 (kg m²)")
     def propellant_I_23(self):
-        return Function(0)
+        return 0
 
     @staticmethod
     def load_from_eng_file(
@@ -1522,14 +1771,18 @@ class GenericMotor(Motor):
         """
         if isinstance(file_name, str):
             if path.splitext(path.basename(file_name))[1] == ".eng":
-                _, description, thrust_source = Motor.import_eng(file_name)
+                # Repeated loads of an unchanged file reuse the parsed data
+                file_name = path.abspath(file_name)
+                file_stat = stat(file_name)
+                description, data_points = _import_eng_cached(
+                    file_name, file_stat.st_mtime_ns, file_stat.st_size
+                )
+                thrust_source = data_points.copy()
             else:
                 raise ValueError("File must be a .eng file.")
         else:
             raise ValueError("File name must be a string.")
 
-        thrust = Function(thrust_source, "Time (s)", "Thrust (N)", "linear", "zero")
-
         # handle eng parameters
         if not chamber_radius:
             chamber_radius = (
@@ -1550,7 +1803,7 @@ class GenericMotor(Motor):
             nozzle_radius = 0.85 * chamber_radius
 
         return GenericMotor(
-            thrust_source=thrust,
+            thrust_source=thrust_source,
             burn_time=burn_time,
             chamber_radius=chamber_radius,
             chamber_height=chamber_height,
@@ -1566,6 +1819,7 @@ class GenericMotor(Motor):
             coordinate_system_orientation=coordinate_system_orientation,
         )
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out all data and graphs available about the Motor."""
         # Print motor details
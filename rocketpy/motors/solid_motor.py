@@ -339,9 +339,15 @@ class SolidMotor(Motor):
 
         self.evaluate_geometry()
 
-        # Initialize plots and prints object
-        self.prints = _SolidMotorPrints(self)
-        self.plots = _SolidMotorPlots(self)
+    @cached_property
+    def prints(self):
+        """Prints object of the motor. It is only created on first access."""
+        return _SolidMotorPrints(self)
+
+    @cached_property
+    def plots(self):
+        """Plots object of the motor. It is only created on first access."""
+        return _SolidMotorPlots(self)
 
     @funcify_method("Time (s)", "Mass (kg)")
     def propellant_mass(self):
@@ -384,7 +390,7 @@ class SolidMotor(Motor):
             self.total_impulse / self.propellant_initial_mass
         ).set_discrete_based_on_model(self.thrust)
 
-    @property
+    @cached_property
     def propellant_initial_mass(self):
         """Returns the initial propellant mass.
 
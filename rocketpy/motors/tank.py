@@ -5,7 +5,7 @@ import numpy as np
 from ..mathutils.function import Function, funcify_method
 from ..plots.tank_plots import _TankPlots
 from ..prints.tank_prints import _TankPrints
-from ..tools import tuple_handler
+from ..tools import skip_if_info_suppressed, tuple_handler
 
 
 class Tank(ABC):
@@ -494,10 +494,12 @@ class Tank(ABC):
         """
         self.plots.draw(filename=filename)
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints out a summary of the tank properties."""
         self.prints.all()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out detailed information and plots of the tank
         properties.
@@ -4,9 +4,32 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.patches import Ellipse
 
+from ..tools import info_suppressed
 from .plot_helpers import show_or_save_plot
 
 
+def _scatter_center_of_pressure(ax, cp_point, label="Center of Pressure"):
+    """Marks the center of pressure with a filled circle inside a ring. Only
+    the inner circle carries the legend label, so the legend has one entry.
+
+    Parameters
+    ----------
+    ax : matplotlib.axes.Axes
+        Axes to draw on.
+    cp_point : tuple, list
+        Coordinates (x, y) of the center of pressure.
+    label : str, optional
+        Legend label of the marker. Default is "Center of Pressure".
+
+    Returns
+    -------
+    None
+    """
+    x, y = cp_point
+    ax.scatter(x, y, label=label, color="red", s=100, zorder=10)
+    ax.scatter(x, y, facecolors="none", edgecolors="red", s=500, zorder=10)
+
+
 class _AeroSurfacePlots(ABC):
     """Abstract class that contains all aero surface plots."""
 
@@ -46,6 +69,8 @@ class _AeroSurfacePlots(ABC):
         -------
         None
         """
+        if info_suppressed():
+            return
         self.draw()
         self.lift()
 
@@ -71,7 +96,8 @@ class _NoseConePlots(_AeroSurfacePlots):
         None
         """
         # Create the vectors X and Y with the points of the curve
-        nosecone_x, nosecone_y = self.aero_surface.shape_vec
+        nosecone_x, nosecone_y = map(np.asarray, self.aero_surface.shape_vec)
+        base_x, base_y = nosecone_x[-1], nosecone_y[-1]
 
         # Figure creation and set up
         _, ax = plt.subplots()
@@ -97,15 +123,10 @@ class _NoseConePlots(_AeroSurfacePlots):
             linestyle="-",
             color="#A60628",
         )  # Ogive's lower side
-        ax.scatter(
-            *cp_plot, label="Center Of Pressure", color="red", s=100, zorder=10
-        )  # Center of pressure inner circle
-        ax.scatter(
-            *cp_plot, facecolors="none", edgecolors="red", s=500, zorder=10
-        )  # Center of pressure outer circle
+        _scatter_center_of_pressure(ax, cp_plot, label="Center Of Pressure")
         # Center Line
         ax.plot(
-            [0, nosecone_x[len(nosecone_x) - 1]],
+            [0, base_x],
             [0, 0],
             linestyle="--",
             color="#7A68A6",
@@ -114,14 +135,8 @@ class _NoseConePlots(_AeroSurfacePlots):
         )
         # Vertical base line
         ax.plot(
-            [
-                nosecone_x[len(nosecone_x) - 1],
-                nosecone_x[len(nosecone_x) - 1],
-            ],
-            [
-                nosecone_y[len(nosecone_y) - 1],
-                -nosecone_y[len(nosecone_y) - 1],
-            ],
+            [base_x, base_x],
+            [base_y, -base_y],
             linestyle="-",
             color="#A60628",
             linewidth=1.5,
@@ -191,6 +206,8 @@ class _FinsPlots(_AeroSurfacePlots):
         -------
         None
         """
+        if info_suppressed():
+            return
         self.draw()
         self.airfoil()
         self.roll()
@@ -219,48 +236,32 @@ class _TrapezoidalFinsPlots(_FinsPlots):
         """
         # Color cycle [#348ABD, #A60628, #7A68A6, #467821, #D55E00, #CC79A7,
         # #56B4E9, #009E73, #F0E442, #0072B2]
-        # Fin
-        leading_edge = plt.Line2D(
-            (0, self.aero_surface.sweep_length),
-            (0, self.aero_surface.span),
-            color="#A60628",
-        )
-        tip = plt.Line2D(
-            (
-                self.aero_surface.sweep_length,
-                self.aero_surface.sweep_length + self.aero_surface.tip_chord,
-            ),
-            (self.aero_surface.span, self.aero_surface.span),
-            color="#A60628",
-        )
-        back_edge = plt.Line2D(
-            (
-                self.aero_surface.sweep_length + self.aero_surface.tip_chord,
-                self.aero_surface.root_chord,
-            ),
-            (self.aero_surface.span, 0),
+        root_chord = self.aero_surface.root_chord
+        tip_chord = self.aero_surface.tip_chord
+        sweep_length = self.aero_surface.sweep_length
+        span = self.aero_surface.span
+        yma = self.aero_surface.Yma
+        tip_end = sweep_length + tip_chord
+
+        # Fin outline: leading edge, tip, back edge and root as one closed line
+        outline = plt.Line2D(
+            np.array((0, sweep_length, tip_end, root_chord, 0), dtype=np.float64),
+            np.array((0, span, span, 0, 0), dtype=np.float64),
             color="#A60628",
         )
-        root = plt.Line2D((self.aero_surface.root_chord, 0), (0, 0), color="#A60628")
 
         # Center and Quarter line
         center_line = plt.Line2D(
-            (
-                self.aero_surface.root_chord / 2,
-                self.aero_surface.sweep_length + self.aero_surface.tip_chord / 2,
-            ),
-            (0, self.aero_surface.span),
+            (root_chord / 2, sweep_length + tip_chord / 2),
+            (0, span),
             color="#7A68A6",
             alpha=0.35,
             linestyle="--",
             label="Center Line",
         )
         quarter_line = plt.Line2D(
-            (
-                self.aero_surface.root_chord / 4,
-                self.aero_surface.sweep_length + self.aero_surface.tip_chord / 4,
-            ),
-            (0, self.aero_surface.span),
+            (root_chord / 4, sweep_length + tip_chord / 4),
+            (0, span),
             color="#7A68A6",
             alpha=1,
             linestyle="--",
@@ -268,24 +269,18 @@ class _TrapezoidalFinsPlots(_FinsPlots):
         )
 
         # Center of pressure
-        cp_point = [self.aero_surface.cpz, self.aero_surface.Yma]
+        cp_point = [self.aero_surface.cpz, yma]
 
         # Mean Aerodynamic Chord
-        yma_start = (
-            self.aero_surface.sweep_length
-            * (self.aero_surface.root_chord + 2 * self.aero_surface.tip_chord)
-            / (3 * (self.aero_surface.root_chord + self.aero_surface.tip_chord))
-        )
+        chord_sum = 3 * (root_chord + tip_chord)
+        yma_start = sweep_length * (root_chord + 2 * tip_chord) / chord_sum
         yma_end = (
-            2 * self.aero_surface.root_chord**2
-            + self.aero_surface.root_chord * self.aero_surface.sweep_length
-            + 2 * self.aero_surface.root_chord * self.aero_surface.tip_chord
-            + 2 * self.aero_surface.sweep_length * self.aero_surface.tip_chord
-            + 2 * self.aero_surface.tip_chord**2
-        ) / (3 * (self.aero_surface.root_chord + self.aero_surface.tip_chord))
+            root_chord * (2 * root_chord + sweep_length + 2 * tip_chord)
+            + 2 * tip_chord * (sweep_length + tip_chord)
+        ) / chord_sum
         yma_line = plt.Line2D(
             (yma_start, yma_end),
-            (self.aero_surface.Yma, self.aero_surface.Yma),
+            (yma, yma),
             color="#467821",
             linestyle="--",
             label="Mean Aerodynamic Chord",
@@ -297,26 +292,16 @@ class _TrapezoidalFinsPlots(_FinsPlots):
             ax = fig.add_subplot(111)
 
         # Fin
-        ax.add_line(leading_edge)
-        ax.add_line(tip)
-        ax.add_line(back_edge)
-        ax.add_line(root)
+        ax.add_line(outline)
 
         ax.add_line(center_line)
         ax.add_line(quarter_line)
         ax.add_line(yma_line)
-        ax.scatter(*cp_point, label="Center of Pressure", color="red", s=100, zorder=10)
-        ax.scatter(*cp_point, facecolors="none", edgecolors="red", s=500, zorder=10)
+        _scatter_center_of_pressure(ax, cp_point)
 
         # Plot settings
-        xlim = (
-            self.aero_surface.root_chord
-            if self.aero_surface.sweep_length + self.aero_surface.tip_chord
-            < self.aero_surface.root_chord
-            else self.aero_surface.sweep_length + self.aero_surface.tip_chord
-        )
-        ax.set_xlim(0, xlim * 1.1)
-        ax.set_ylim(0, self.aero_surface.span * 1.1)
+        ax.set_xlim(0, max(root_chord, tip_end) * 1.1)
+        ax.set_ylim(0, span * 1.1)
         ax.set_xlabel("Root chord (m)")
         ax.set_ylabel("Span (m)")
         ax.set_title("Trapezoidal Fin Cross Section")
@@ -346,34 +331,35 @@ class _EllipticalFinsPlots(_FinsPlots):
         -------
         None
         """
+        root_chord = self.aero_surface.root_chord
+        span = self.aero_surface.span
+        yma = self.aero_surface.Yma
+
         # Ellipse
         ellipse = Ellipse(
-            (self.aero_surface.root_chord / 2, 0),
-            self.aero_surface.root_chord,
-            self.aero_surface.span * 2,
+            (root_chord / 2, 0),
+            root_chord,
+            span * 2,
             fill=False,
             edgecolor="#A60628",
             linewidth=2,
         )
 
         # Mean Aerodynamic Chord # From Barrowman's theory
-        yma_length = 8 * self.aero_surface.root_chord / (3 * np.pi)
-        yma_start = (self.aero_surface.root_chord - yma_length) / 2
-        yma_end = (
-            self.aero_surface.root_chord
-            - (self.aero_surface.root_chord - yma_length) / 2
-        )
+        yma_length = 8 * root_chord / (3 * np.pi)
+        yma_start = (root_chord - yma_length) / 2
+        yma_end = root_chord - yma_start
         yma_line = plt.Line2D(
             (yma_start, yma_end),
-            (self.aero_surface.Yma, self.aero_surface.Yma),
+            (yma, yma),
             label="Mean Aerodynamic Chord",
             color="#467821",
         )
 
         # Center Line
         center_line = plt.Line2D(
-            (self.aero_surface.root_chord / 2, self.aero_surface.root_chord / 2),
-            (0, self.aero_surface.span),
+            (root_chord / 2, root_chord / 2),
+            (0, span),
             color="#7A68A6",
             alpha=0.35,
             linestyle="--",
@@ -381,7 +367,7 @@ class _EllipticalFinsPlots(_FinsPlots):
         )
 
         # Center of pressure
-        cp_point = [self.aero_surface.cpz, self.aero_surface.Yma]
+        cp_point = [self.aero_surface.cpz, yma]
 
         # Plotting
         fig = plt.figure(figsize=(7, 4))
@@ -390,12 +376,11 @@ class _EllipticalFinsPlots(_FinsPlots):
         ax.add_patch(ellipse)
         ax.add_line(yma_line)
         ax.add_line(center_line)
-        ax.scatter(*cp_point, label="Center of Pressure", color="red", s=100, zorder=10)
-        ax.scatter(*cp_point, facecolors="none", edgecolors="red", s=500, zorder=10)
+        _scatter_center_of_pressure(ax, cp_point)
 
         # Plot settings
-        ax.set_xlim(0, self.aero_surface.root_chord)
-        ax.set_ylim(0, self.aero_surface.span * 1.1)
+        ax.set_xlim(0, root_chord)
+        ax.set_ylim(0, span * 1.1)
         ax.set_xlabel("Root chord (m)")
         ax.set_ylabel("Span (m)")
         ax.set_title("Elliptical Fin Cross Section")
@@ -428,16 +413,16 @@ class _FreeFormFinsPlots(_FinsPlots):
         # Color cycle [#348ABD, #A60628, #7A68A6, #467821, #D55E00, #CC79A7,
         # #56B4E9, #009E73, #F0E442, #0072B2]
 
+        yma = self.aero_surface.Yma
+        mac_lead = self.aero_surface.mac_lead
+
         # Center of pressure
-        cp_point = [self.aero_surface.cpz, self.aero_surface.Yma]
+        cp_point = [self.aero_surface.cpz, yma]
 
         # Mean Aerodynamic Chord
         yma_line = plt.Line2D(
-            (
-                self.aero_surface.mac_lead,
-                self.aero_surface.mac_lead + self.aero_surface.mac_length,
-            ),
-            (self.aero_surface.Yma, self.aero_surface.Yma),
+            (mac_lead, mac_lead + self.aero_surface.mac_length),
+            (yma, yma),
             color="#467821",
             linestyle="--",
             label="Mean Aerodynamic Chord",
@@ -449,26 +434,13 @@ class _FreeFormFinsPlots(_FinsPlots):
             ax = fig.add_subplot(111)
 
         # Fin
-        ax.scatter(
-            self.aero_surface.shape_vec[0],
-            self.aero_surface.shape_vec[1],
-            color="#A60628",
-        )
-        ax.plot(
-            self.aero_surface.shape_vec[0],
-            self.aero_surface.shape_vec[1],
-            color="#A60628",
-        )
-        # line from the last point to the first point
-        ax.plot(
-            [self.aero_surface.shape_vec[0][-1], self.aero_surface.shape_vec[0][0]],
-            [self.aero_surface.shape_vec[1][-1], self.aero_surface.shape_vec[1][0]],
-            color="#A60628",
-        )
+        fin_x, fin_y = self.aero_surface.shape_vec
+        ax.scatter(fin_x, fin_y, color="#A60628")
+        # closed outline, back from the last point to the first point
+        ax.plot(np.append(fin_x, fin_x[0]), np.append(fin_y, fin_y[0]), color="#A60628")
 
         ax.add_line(yma_line)
-        ax.scatter(*cp_point, label="Center of Pressure", color="red", s=100, zorder=10)
-        ax.scatter(*cp_point, facecolors="none", edgecolors="red", s=500, zorder=10)
+        _scatter_center_of_pressure(ax, cp_point)
 
         # Plot settings
         ax.set_xlabel("Root chord (m)")
@@ -508,6 +480,8 @@ class _AirBrakesPlots(_AeroSurfacePlots):
         -------
         None
         """
+        if info_suppressed():
+            return
         self.drag_coefficient_curve()
 
 
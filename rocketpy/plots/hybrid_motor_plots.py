@@ -1,5 +1,6 @@
 from matplotlib import pyplot as plt
 
+from ..tools import info_suppressed
 from .motor_plots import _MotorPlots
 from .plot_helpers import show_or_save_plot
 
@@ -198,6 +199,8 @@ class _HybridMotorPlots(_MotorPlots):
         -------
         None
         """
+        if info_suppressed():
+            return
         self.draw()
         self.thrust(*self.motor.burn_time)
         self.total_mass(*self.motor.burn_time)
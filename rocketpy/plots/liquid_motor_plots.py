@@ -1,5 +1,6 @@
 import matplotlib.pyplot as plt
 
+from ..tools import info_suppressed
 from .motor_plots import _MotorPlots
 from .plot_helpers import show_or_save_plot
 
@@ -60,6 +61,8 @@ class _LiquidMotorPlots(_MotorPlots):
         -------
         None
         """
+        if info_suppressed():
+            return
         self.draw()
         self.thrust(*self.motor.burn_time)
         self.mass_flow_rate(*self.motor.burn_time)
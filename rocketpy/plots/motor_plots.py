@@ -3,6 +3,7 @@ import numpy as np
 from matplotlib.patches import Polygon
 
 from ..plots.plot_helpers import show_or_save_plot
+from ..tools import info_suppressed
 
 
 class _MotorPlots:
@@ -528,6 +529,8 @@ class _MotorPlots:
         -------
         None
         """
+        if info_suppressed():
+            return
         self.thrust(*self.motor.burn_time)
         # self.mass_flow_rate(*self.motor.burn_time)
         self.exhaust_velocity(*self.motor.burn_time)
@@ -4,6 +4,7 @@ import numpy as np
 from rocketpy.motors import EmptyMotor, HybridMotor, LiquidMotor, SolidMotor
 from rocketpy.rocket.aero_surface import Fins, NoseCone, Tail
 from rocketpy.rocket.aero_surface.generic_surface import GenericSurface
+from rocketpy.tools import info_suppressed
 
 from .plot_helpers import show_or_save_plot
 
@@ -643,6 +644,8 @@ class _RocketPlots:
         -------
         None
         """
+        if info_suppressed():
+            return
 
         # Rocket draw
         if len(self.rocket.aerodynamic_surfaces) > 0:
@@ -1,4 +1,7 @@
+import sys
+
 from rocketpy.rocket.aero_surface.generic_surface import GenericSurface
+from rocketpy.tools import info_suppressed
 
 
 class _RocketPrints:
@@ -32,29 +35,22 @@ class _RocketPrints:
         -------
         None
         """
-        print("\nInertia Details\n")
-        print(f"Rocket Mass: {self.rocket.mass:.3f} kg (without motor)")
-        print(f"Rocket Dry Mass: {self.rocket.dry_mass:.3f} kg (with unloaded motor)")
-        print(f"Rocket Loaded Mass: {self.rocket.total_mass(0):.3f} kg")
-        print(f"Rocket Structural Mass Ratio: {self.rocket.structural_mass_ratio:.3f}")
-        print(
-            f"Rocket Inertia (with unloaded motor) 11: {self.rocket.dry_I_11:.3f} kg*m2"
-        )
-        print(
-            f"Rocket Inertia (with unloaded motor) 22: {self.rocket.dry_I_22:.3f} kg*m2"
-        )
-        print(
-            f"Rocket Inertia (with unloaded motor) 33: {self.rocket.dry_I_33:.3f} kg*m2"
-        )
-        print(
-            f"Rocket Inertia (with unloaded motor) 12: {self.rocket.dry_I_12:.3f} kg*m2"
-        )
-        print(
-            f"Rocket Inertia (with unloaded motor) 13: {self.rocket.dry_I_13:.3f} kg*m2"
-        )
-        print(
-            f"Rocket Inertia (with unloaded motor) 23: {self.rocket.dry_I_23:.3f} kg*m2"
-        )
+        if info_suppressed():
+            return
+        rocket = self.rocket
+        lines = [
+            "\nInertia Details\n",
+            f"Rocket Mass: {rocket.mass:.3f} kg (without motor)",
+            f"Rocket Dry Mass: {rocket.dry_mass:.3f} kg (with unloaded motor)",
+            f"Rocket Loaded Mass: {rocket.total_mass(0):.3f} kg",
+            f"Rocket Structural Mass Ratio: {rocket.structural_mass_ratio:.3f}",
+        ]
+        for component in ("11", "22", "33", "12", "13", "23"):
+            inertia = getattr(rocket, f"dry_I_{component}")
+            lines.append(
+                f"Rocket Inertia (with unloaded motor) {component}: {inertia:.3f} kg*m2"
+            )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def rocket_geometrical_parameters(self):
         """Print rocket geometrical parameters.
@@ -63,36 +59,32 @@ class _RocketPrints:
         -------
         None
         """
-        print("\nGeometrical Parameters\n")
-        print(f"Rocket Maximum Radius: {self.rocket.radius} m")
-        print(f"Rocket Frontal Area: {self.rocket.area:.6f} m2")
-
-        print("\nRocket Distances")
-        distance = abs(
-            self.rocket.center_of_mass_without_motor
-            - self.rocket.center_of_dry_mass_position
-        )
-        print(
+        if info_suppressed():
+            return
+        rocket = self.rocket
+        center_of_dry_mass = rocket.center_of_dry_mass_position
+        lines = [
+            "\nGeometrical Parameters\n",
+            f"Rocket Maximum Radius: {rocket.radius} m",
+            f"Rocket Frontal Area: {rocket.area:.6f} m2",
+            "\nRocket Distances",
+        ]
+        distance = abs(rocket.center_of_mass_without_motor - center_of_dry_mass)
+        lines.append(
             "Rocket Center of Dry Mass - Center of Mass without Motor: "
             f"{distance:.3f} m"
         )
-        distance = abs(
-            self.rocket.center_of_dry_mass_position - self.rocket.nozzle_position
-        )
-        print(f"Rocket Center of Dry Mass - Nozzle Exit: {distance:.3f} m")
-        distance = abs(
-            self.rocket.center_of_propellant_position(0)
-            - self.rocket.center_of_dry_mass_position
-        )
-        print(
+        distance = abs(center_of_dry_mass - rocket.nozzle_position)
+        lines.append(f"Rocket Center of Dry Mass - Nozzle Exit: {distance:.3f} m")
+        distance = abs(rocket.center_of_propellant_position(0) - center_of_dry_mass)
+        lines.append(
             f"Rocket Center of Dry Mass - Center of Propellant Mass: {distance:.3f} m"
         )
-        distance = abs(
-            self.rocket.center_of_mass(0) - self.rocket.center_of_dry_mass_position
-        )
-        print(
+        distance = abs(rocket.center_of_mass(0) - center_of_dry_mass)
+        lines.append(
             f"Rocket Center of Mass - Rocket Loaded Center of Mass: {distance:.3f} m\n"
         )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def rocket_aerodynamics_quantities(self):
         """Print rocket aerodynamics quantities.
@@ -101,45 +93,44 @@ class _RocketPrints:
         -------
         None
         """
-        print("\nAerodynamics Lift Coefficient Derivatives\n")
-        for surface, _ in self.rocket.aerodynamic_surfaces:
+        if info_suppressed():
+            return
+        rocket = self.rocket
+        # Values printed more than once are evaluated a single time
+        rocket_radius = rocket.radius
+        center_of_mass = rocket.center_of_mass(0)
+        cp_position = rocket.cp_position(0)
+
+        lines = ["\nAerodynamics Lift Coefficient Derivatives\n"]
+        for surface, _ in rocket.aerodynamic_surfaces:
             if isinstance(surface, GenericSurface):
                 continue
-            name = surface.name
             # ref_factor corrects lift for different reference areas
-            ref_factor = (surface.rocket_radius / self.rocket.radius) ** 2
-            print(
-                f"{name} Lift Coefficient Derivative: "
+            ref_factor = (surface.rocket_radius / rocket_radius) ** 2
+            lines.append(
+                f"{surface.name} Lift Coefficient Derivative: "
                 f"{ref_factor * surface.clalpha(0):.3f}/rad"
             )
 
-        print("\nCenter of Pressure\n")
-        for surface, position in self.rocket.aerodynamic_surfaces:
-            name = surface.name
+        lines.append("\nCenter of Pressure\n")
+        for surface, position in rocket.aerodynamic_surfaces:
             cpz = surface.cp[2]  # relative to the user defined coordinate system
-            print(
-                f"{name} Center of Pressure position: "
-                f"{position.z - self.rocket._csys * cpz:.3f} m"
+            lines.append(
+                f"{surface.name} Center of Pressure position: "
+                f"{position.z - rocket._csys * cpz:.3f} m"
             )
-        print("\nStability\n")
-        print(
-            f"Center of Mass position (time=0): {self.rocket.center_of_mass(0):.3f} m"
-        )
-        print(
-            f"Center of Pressure position (time=0): {self.rocket.cp_position(0):.3f} m"
-        )
-        print(
-            f"Initial Static Margin (mach=0, time=0): "
-            f"{self.rocket.static_margin(0):.3f} c"
-        )
-        print(
+
+        lines += [
+            "\nStability\n",
+            f"Center of Mass position (time=0): {center_of_mass:.3f} m",
+            f"Center of Pressure position (time=0): {cp_position:.3f} m",
+            f"Initial Static Margin (mach=0, time=0): {rocket.static_margin(0):.3f} c",
             f"Final Static Margin (mach=0, time=burn_out): "
-            f"{self.rocket.static_margin(self.rocket.motor.burn_out_time):.3f} c"
-        )
-        print(
+            f"{rocket.static_margin(rocket.motor.burn_out_time):.3f} c",
             f"Rocket Center of Mass (time=0) - Center of Pressure (mach=0): "
-            f"{abs(self.rocket.center_of_mass(0) - self.rocket.cp_position(0)):.3f} m\n"
-        )
+            f"{abs(center_of_mass - cp_position):.3f} m\n",
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def parachute_data(self):
         """Print parachute data.
@@ -158,6 +149,8 @@ class _RocketPrints:
         -------
         None
         """
+        if info_suppressed():
+            return
         self.inertia_details()
         self.rocket_geometrical_parameters()
         self.rocket_aerodynamics_quantities()
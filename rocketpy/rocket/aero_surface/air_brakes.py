@@ -5,6 +5,7 @@ import numpy as np
 from rocketpy.mathutils.function import Function
 from rocketpy.plots.aero_surface_plots import _AirBrakesPlots
 from rocketpy.prints.aero_surface_prints import _AirBrakesPrints
+from rocketpy.tools import skip_if_info_suppressed
 
 from .aero_surface import AeroSurface
 
@@ -187,6 +188,7 @@ class AirBrakes(AeroSurface):
         None
         """
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints and plots summarized information of the aerodynamic surface.
 
@@ -196,6 +198,7 @@ class AirBrakes(AeroSurface):
         """
         self.prints.geometry()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints and plots all information of the aerodynamic surface.
 
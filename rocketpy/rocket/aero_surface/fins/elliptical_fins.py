@@ -2,6 +2,7 @@ import numpy as np
 
 from rocketpy.plots.aero_surface_plots import _EllipticalFinsPlots
 from rocketpy.prints.aero_surface_prints import _EllipticalFinsPrints
+from rocketpy.tools import skip_if_info_suppressed
 
 from .fins import Fins
 
@@ -309,10 +310,12 @@ class EllipticalFins(Fins):
         y_array = self.span * np.sin(np.radians(angles))
         self.shape_vec = [x_array, y_array]
 
+    @skip_if_info_suppressed
     def info(self):
         self.prints.geometry()
         self.prints.lift()
 
+    @skip_if_info_suppressed
     def all_info(self):
         self.prints.all()
         self.plots.all()
@@ -4,6 +4,7 @@ import numpy as np
 
 from rocketpy.plots.aero_surface_plots import _FreeFormFinsPlots
 from rocketpy.prints.aero_surface_prints import _FreeFormFinsPrints
+from rocketpy.tools import skip_if_info_suppressed
 
 from .fins import Fins
 
@@ -392,10 +393,12 @@ class FreeFormFins(Fins):
             data["name"],
         )
 
+    @skip_if_info_suppressed
     def info(self):
         self.prints.geometry()
         self.prints.lift()
 
+    @skip_if_info_suppressed
     def all_info(self):
         self.prints.all()
         self.plots.all()
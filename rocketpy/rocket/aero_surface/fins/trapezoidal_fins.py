@@ -2,6 +2,7 @@ import numpy as np
 
 from rocketpy.plots.aero_surface_plots import _TrapezoidalFinsPlots
 from rocketpy.prints.aero_surface_prints import _TrapezoidalFinsPrints
+from rocketpy.tools import skip_if_info_suppressed
 
 from .fins import Fins
 
@@ -340,10 +341,12 @@ class TrapezoidalFins(Fins):
         x_array, y_array = zip(*points)
         self.shape_vec = [np.array(x_array), np.array(y_array)]
 
+    @skip_if_info_suppressed
     def info(self):
         self.prints.geometry()
         self.prints.lift()
 
+    @skip_if_info_suppressed
     def all_info(self):
         self.prints.all()
         self.plots.all()
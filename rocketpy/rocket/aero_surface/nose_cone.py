@@ -6,6 +6,7 @@ from scipy.optimize import fsolve
 from rocketpy.mathutils.function import Function
 from rocketpy.plots.aero_surface_plots import _NoseConePlots
 from rocketpy.prints.aero_surface_prints import _NoseConePrints
+from rocketpy.tools import skip_if_info_suppressed
 
 from .aero_surface import AeroSurface
 
@@ -503,6 +504,7 @@ class NoseCone(AeroSurface):
         """
         self.plots.draw(filename=filename)
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints and plots summarized information of the nose cone.
 
@@ -513,6 +515,7 @@ class NoseCone(AeroSurface):
         self.prints.geometry()
         self.prints.lift()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints and plots all the available information of the nose cone.
 
@@ -2,6 +2,7 @@ import numpy as np
 
 from rocketpy.mathutils.function import Function
 from rocketpy.prints.aero_surface_prints import _RailButtonsPrints
+from rocketpy.tools import skip_if_info_suppressed
 
 from .aero_surface import AeroSurface
 
@@ -117,6 +118,7 @@ class RailButtons(AeroSurface):
             data["rocket_radius"],
         )
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints out all the information about the Rail Buttons.
 
@@ -126,6 +128,7 @@ class RailButtons(AeroSurface):
         """
         self.prints.geometry()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Returns all info of the Rail Buttons.
 
@@ -3,6 +3,7 @@ import numpy as np
 from rocketpy.mathutils.function import Function
 from rocketpy.plots.aero_surface_plots import _TailPlots
 from rocketpy.prints.aero_surface_prints import _TailPrints
+from rocketpy.tools import skip_if_info_suppressed
 
 from .aero_surface import AeroSurface
 
@@ -197,10 +198,12 @@ class Tail(AeroSurface):
         self.cpz = cpz
         self.cp = (self.cpx, self.cpy, self.cpz)
 
+    @skip_if_info_suppressed
     def info(self):
         self.prints.geometry()
         self.prints.lift()
 
+    @skip_if_info_suppressed
     def all_info(self):
         self.prints.all()
         self.plots.all()
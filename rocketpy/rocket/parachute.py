@@ -2,7 +2,11 @@ from inspect import signature
 
 import numpy as np
 
-from rocketpy.tools import from_hex_decode, to_hex_encode
+from rocketpy.tools import (
+    from_hex_decode,
+    skip_if_info_suppressed,
+    to_hex_encode,
+)
 
 from ..mathutils.function import Function
 from ..prints.parachute_prints import _ParachutePrints
@@ -242,10 +246,12 @@ class Parachute:
             + f"(cd_s = {self.cd_s:.4f} m2, trigger = {self.trigger})>"
         )
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints information about the Parachute class."""
         self.prints.all()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints all information about the Parachute class."""
         self.info()
@@ -22,7 +22,7 @@ from rocketpy.rocket.aero_surface.fins.free_form_fins import FreeFormFins
 from rocketpy.rocket.aero_surface.generic_surface import GenericSurface
 from rocketpy.rocket.components import Components
 from rocketpy.rocket.parachute import Parachute
-from rocketpy.tools import parallel_axis_theorem_from_com
+from rocketpy.tools import parallel_axis_theorem_from_com, skip_if_info_suppressed
 
 
 # pylint: disable=too-many-instance-attributes, too-many-public-methods, too-many-instance-attributes
@@ -448,14 +448,10 @@ class Rocket:
             Initial structural mass ratio dry mass (Rocket + Motor) (kg)
             divided by total mass (Rocket + Motor + Propellant) (kg).
         """
-        try:
-            self.structural_mass_ratio = self.dry_mass / (
-                self.dry_mass + self.motor.propellant_initial_mass
-            )
-        except ZeroDivisionError as e:
-            raise ValueError(
-                "Total rocket mass (dry + propellant) cannot be zero"
-            ) from e
+        initial_total_mass = self.dry_mass + self.motor.propellant_initial_mass
+        if initial_total_mass == 0:
+            raise ValueError("Total rocket mass (dry + propellant) cannot be zero")
+        self.structural_mass_ratio = self.dry_mass / initial_total_mass
         return self.structural_mass_ratio
 
     def evaluate_center_of_mass(self):
@@ -1872,6 +1868,7 @@ class Rocket:
         """
         self.plots.draw(vis_args, plane, filename=filename)
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints out a summary of the data and graphs available about
         the Rocket.
@@ -1882,6 +1879,7 @@ class Rocket:
         """
         self.prints.all()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out all data and graphs available about the Rocket.
 
@@ -2,7 +2,11 @@ import numpy as np
 
 from rocketpy.plots.sensitivity_plots import _SensitivityModelPlots
 from rocketpy.prints.sensitivity_prints import _SensitivityModelPrints
-from rocketpy.tools import check_requirement_version, import_optional_dependency
+from rocketpy.tools import (
+    check_requirement_version,
+    import_optional_dependency,
+    skip_if_info_suppressed,
+)
 
 
 class SensitivityModel:
@@ -270,9 +274,11 @@ class SensitivityModel:
             self.target_variables_info[target_variable]["LAE"] = var_eps
             self.target_variables_info[target_variable]["LAE"] /= var_y
 
+    @skip_if_info_suppressed
     def info(self):
         self.prints.all()
 
+    @skip_if_info_suppressed
     def all_info(self):
         self.prints.all()
         self.plots.all()
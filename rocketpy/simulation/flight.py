@@ -22,6 +22,7 @@ from ..tools import (
     quaternions_to_nutation,
     quaternions_to_precession,
     quaternions_to_spin,
+    skip_if_info_suppressed,
 )
 
 ODE_SOLVER_MAP = {
@@ -3402,10 +3403,12 @@ class Flight:
         kml.save(file_name)
         print("File ", file_name, " saved with success!")
 
+    @skip_if_info_suppressed
     def info(self):
         """Prints out a summary of the data available about the Flight."""
         self.prints.all()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """Prints out all data and graphs available about the Flight."""
         self.info()
@@ -31,6 +31,7 @@ from rocketpy.tools import (
     generate_monte_carlo_ellipses,
     generate_monte_carlo_ellipses_coordinates,
     import_optional_dependency,
+    skip_if_info_suppressed,
 )
 
 # TODO: Create evolution plots to analyze convergence
@@ -1082,6 +1083,7 @@ class MonteCarlo:
 
         kml.save(filename)
 
+    @skip_if_info_suppressed
     def info(self):
         """
         Print information about the Monte Carlo simulation.
@@ -1092,6 +1094,7 @@ class MonteCarlo:
         """
         self.prints.all()
 
+    @skip_if_info_suppressed
     def all_info(self):
         """
         Print and plot information about the Monte Carlo simulation and its results.
@@ -12,9 +12,12 @@ import importlib
 import importlib.metadata
 import json
 import math
+import os
 import re
+import threading
 import time
 from bisect import bisect_left
+from contextlib import contextmanager
 
 import dill
 import matplotlib.pyplot as plt
@@ -27,6 +30,13 @@ from packaging import version as packaging_version
 # Mapping of module name and the name of the package that should be installed
 INSTALL_MAPPING = {"IPython": "ipython"}
 
+# Whether info reports are skipped for the whole session, set with the
+# ROCKETPY_SUPPRESS_INFO environment variable
+_INFO_SUPPRESSED = os.environ.get("ROCKETPY_SUPPRESS_INFO") == "1"
+# Number of open suppress_info blocks, only changed while holding the lock
+_INFO_SUPPRESS_DEPTH = 0
+_INFO_SUPPRESS_LOCK = threading.Lock()
+
 
 def tuple_handler(value):
     """Transforms the input value into a tuple that represents a range. If the
@@ -997,6 +1007,65 @@ def exponential_backoff(max_attempts, base_delay=1, max_delay=60):
     return decorator
 
 
+@contextmanager
+def suppress_info():
+    """Context manager that turns the ``info`` and ``all_info`` reports of
+    RocketPy objects, such as ``Flight.all_info`` and ``Motor.info``, and the
+    ``prints.all`` and ``plots.all`` methods they call into no-ops. This is
+    useful in scripts and Monte Carlo runs in which the printed text and the
+    plots are never seen. Setting the ``ROCKETPY_SUPPRESS_INFO`` environment
+    variable to ``1`` suppresses them for the whole session instead. Reports
+    called with an explicit ``filename`` still run, so requested files are
+    always saved.
+
+    The suppression is process wide: while any thread is inside a
+    ``suppress_info`` block, the reports of every thread are skipped. The
+    block count is updated under a lock, so blocks entered and left by
+    different threads never restore a stale state.
+
+    Examples
+    --------
+    >>> from rocketpy.tools import suppress_info, info_suppressed
+    >>> with suppress_info():
+    ...     info_suppressed()
+    True
+    """
+    global _INFO_SUPPRESS_DEPTH  # pylint: disable=global-statement
+    with _INFO_SUPPRESS_LOCK:
+        _INFO_SUPPRESS_DEPTH += 1
+    try:
+        yield
+    finally:
+        with _INFO_SUPPRESS_LOCK:
+            _INFO_SUPPRESS_DEPTH -= 1
+
+
+def info_suppressed():
+    """Returns whether the info reports are currently suppressed.
+
+    Returns
+    -------
+    bool
+        True inside a ``suppress_info`` block or when the
+        ``ROCKETPY_SUPPRESS_INFO`` environment variable is set to ``1``.
+    """
+    return _INFO_SUPPRESSED or _INFO_SUPPRESS_DEPTH > 0
+
+
+def skip_if_info_suppressed(func):
+    """Decorator for the ``info`` and ``all_info`` report methods, which
+    returns None without running the decorated method while the info reports
+    are suppressed, unless a ``filename`` to save the report to is given."""
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if info_suppressed() and kwargs.get("filename") is None:
+            return None
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 def parallel_axis_theorem_from_com(com_inertia_moment, mass, distance):
     """Calculates the moment of inertia of a object relative to a new axis using
     the parallel axis theorem. The new axis is parallel to and at a distance
@@ -1,44 +1,36 @@
-import pandas as pd
 import pytest
 
+VALID_COEFFICIENTS_CSV = "alpha,mach,cL_0\n0,3,4\n1,2,2\n2,1,2\n3,0,4\n0.1,0.2,5\n"
+INVALID_COEFFICIENTS_CSVS = (
+    # the coefficient column must be the last one
+    "alpha,cL_0,mach\n0,4,3\n1,2,2\n2,2,1\n3,4,0\n0.1,5,0.2\n",
+    # at least one known independent variable must be present
+    "a,b\n0,4\n1,2\n2,2\n3,4\n0.1,5\n",
+)
+
 
 @pytest.fixture(scope="session")
-def filename_valid_coeff_linear_generic_surface(tmpdir_factory):
+def filename_valid_coeff_linear_generic_surface(aero_surface_data_dir):
     """Creates temporary files used to test if a linear generic surface
     initializes correctly from CSV files"""
-    filename = tmpdir_factory.mktemp("aero_surface_data").join(
-        "valid_coefficients_lgs.csv"
-    )
-    pd.DataFrame(
-        {
-            "alpha": [0, 1, 2, 3, 0.1],
-            "mach": [3, 2, 1, 0, 0.2],
-            "cL_0": [4, 2, 2, 4, 5],
-        }
-    ).to_csv(filename, index=False)
+    filename = aero_surface_data_dir / "valid_coefficients_lgs.csv"
+    filename.write_text(VALID_COEFFICIENTS_CSV, encoding="ascii")
 
     return filename
 
 
 @pytest.fixture(
-    params=(
-        {
-            "alpha": [0, 1, 2, 3, 0.1],
-            "cL_0": [4, 2, 2, 4, 5],
-            "mach": [3, 2, 1, 0, 0.2],
-        },
-        {
-            "a": [0, 1, 2, 3, 0.1],
-            "b": [4, 2, 2, 4, 5],
-        },
-    )
+    scope="session",
+    params=INVALID_COEFFICIENTS_CSVS,
+    ids=("unordered_columns", "unknown_columns"),
 )
-def filename_invalid_coeff_linear_generic_surface(tmpdir_factory, request):
+def filename_invalid_coeff_linear_generic_surface(aero_surface_data_dir, request):
     """Creates temporary CSV files used to test if a linear generic surface
     raises errors when initialized incorrectly from CSV files"""
-    filename = tmpdir_factory.mktemp("aero_surface_data").join(
-        "tmp_invalid_coefficients_lgs.csv"
+    filename = (
+        aero_surface_data_dir
+        / f"tmp_invalid_coefficients_lgs_{request.param_index}.csv"
     )
-    pd.DataFrame(request.param).to_csv(filename, index=False)
+    filename.write_text(request.param, encoding="ascii")
 
     return filename
@@ -30,6 +30,31 @@ def generic_motor():
     return motor
 
 
+@pytest.fixture
+def generic_motor_constant_thrust():
+    """An example of a generic motor with a constant thrust source, whose
+    total impulse is known analytically.
+
+    Returns
+    -------
+    rocketpy.GenericMotor
+    """
+    motor = GenericMotor(
+        burn_time=(2, 7),
+        thrust_source=1500,
+        chamber_height=0.5,
+        chamber_radius=0.075,
+        chamber_position=-0.25,
+        propellant_initial_mass=5.0,
+        nozzle_position=-0.5,
+        nozzle_radius=0.075,
+        dry_mass=8.0,
+        dry_inertia=(0.2, 0.2, 0.08),
+    )
+
+    return motor
+
+
 @pytest.fixture
 def generic_motor_cesaroni_M1520():
     """Defines a Cesaroni M1520 motor for the Prometheus rocket using the
@@ -198,6 +198,35 @@ def test_get_value_opt(x, y, z):
     assert np.isclose(func.get_value_opt(x, y), z, atol=1e-6)
 
 
+@pytest.mark.parametrize("interpolation", ["linear", "akima", "spline"])
+@pytest.mark.parametrize("extrapolation", ["natural", "constant", "zero"])
+def test_get_value_opt_without_numba(monkeypatch, interpolation, extrapolation):
+    """Test that the pure Python interpolation functions, used when numba is
+    not installed, match the default ones of 1-D Functions.
+
+    Parameters
+    ----------
+    monkeypatch : pytest.MonkeyPatch
+        Used to hide numba from the Function module.
+    interpolation : str
+        The interpolation method of the Functions.
+    extrapolation : str
+        The extrapolation method of the Functions.
+    """
+    x_data = np.linspace(0, 10, 25)
+    source = np.column_stack((x_data, np.sin(x_data)))
+    default_func = Function(source, interpolation=interpolation)
+    default_func.set_extrapolation(extrapolation)
+    monkeypatch.setattr("rocketpy.mathutils.function.njit", None)
+    python_func = Function(source, interpolation=interpolation)
+    python_func.set_extrapolation(extrapolation)
+
+    for x in [-1, 0, 0.3, 2.5, 4.1666, 7, 9.99, 10, 11]:
+        assert python_func.get_value_opt(x) == pytest.approx(
+            default_func.get_value_opt(x), abs=1e-12
+        )
+
+
 @pytest.mark.parametrize("samples", [2, 50, 1000])
 def test_set_discrete_mutator(samples):
     """Tests the set_discrete method of the Function class."""
@@ -370,6 +399,18 @@ class TestInterpolationMethods:
         assert linear_func.get_interpolation_method() == "akima"
         assert np.isclose(linear_func.get_value(0), 0.0, atol=1e-6)
 
+    def test_akima_interpolation_fits_data(self):
+        """Tests that the Akima interpolation goes through every data point and
+        that its first derivative is continuous at the inner points."""
+        x = np.array([0, 1, 1.5, 3, 4, 6])
+        y = np.array([0, 2, 1, 3, -1, 0.5])
+        func = Function(np.column_stack((x, y)), interpolation="akima")
+        assert np.allclose([func.get_value_opt(xi) for xi in x], y)
+        for xi in x[1:-1]:
+            left = func.differentiate(xi - 1e-6, dx=1e-7)
+            right = func.differentiate(xi + 1e-6, dx=1e-7)
+            assert left == pytest.approx(right, rel=1e-4, abs=1e-4)
+
     def test_polynomial_interpolation(self, linear_func):
         """Tests polynomial interpolation method"""
         assert isinstance(linear_func.set_interpolation("polynomial"), Function)
@@ -1,8 +1,11 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 import scipy.integrate
 
 from rocketpy import Function, Motor
+from rocketpy.motors.motor import _import_eng_cached
 
 BURN_TIME = (2, 7)
 
@@ -69,7 +72,100 @@ def test_generic_motor_thrust_parameters(generic_motor):
     assert generic_motor.exhaust_velocity.average(*BURN_TIME) == pytest.approx(
         expected_exhaust_velocity
     )
+    assert generic_motor.exhaust_velocity(BURN_TIME[1]) == pytest.approx(
+        expected_exhaust_velocity
+    )
     assert mass_flow_rate.y_array == pytest.approx(expected_mass_flow_rate)
+    assert generic_motor.mass_flow_rate is not generic_motor.total_mass_flow_rate
+    assert generic_motor.mass_flow_rate.y_array == pytest.approx(
+        expected_mass_flow_rate
+    )
+    assert generic_motor.mass_flow_rate.get_outputs() == ["Mass Flow Rate (kg/s)"]
+    assert generic_motor.total_mass_flow_rate.get_outputs() == ["Mass flow rate (kg/s)"]
+
+
+def test_generic_motor_propellant_mass(generic_motor):
+    """Tests the GenericMotor propellant mass against the generic integral
+    of the total mass flow rate.
+
+    Parameters
+    ----------
+    generic_motor : rocketpy.GenericMotor
+        The GenericMotor object to be used in the tests.
+    """
+    expected_propellant_mass = (
+        generic_motor.total_mass_flow_rate.integral_function() + PROPELLANT_INITIAL_MASS
+    )
+
+    assert generic_motor.propellant_mass.x_array == pytest.approx(
+        expected_propellant_mass.x_array
+    )
+    assert generic_motor.propellant_mass.y_array == pytest.approx(
+        expected_propellant_mass.y_array
+    )
+    assert generic_motor.propellant_mass(BURN_TIME[0]) == pytest.approx(
+        PROPELLANT_INITIAL_MASS
+    )
+    assert generic_motor.propellant_mass(BURN_TIME[1]) == pytest.approx(0, abs=1e-9)
+
+
+def test_generic_motor_reset_propellant_caches(generic_motor):
+    """Tests that resetting the propellant caches of a GenericMotor keeps its
+    propellant initial mass and recomputes the cached values.
+
+    Parameters
+    ----------
+    generic_motor : rocketpy.GenericMotor
+        The GenericMotor object to be used in the tests.
+    """
+    exhaust_velocity = generic_motor._average_exhaust_velocity
+
+    generic_motor._reset_propellant_caches()
+
+    assert "_average_exhaust_velocity" not in generic_motor.__dict__
+    assert generic_motor.propellant_initial_mass == PROPELLANT_INITIAL_MASS
+    assert generic_motor._average_exhaust_velocity == pytest.approx(exhaust_velocity)
+    assert generic_motor.propellant_mass(BURN_TIME[0]) == pytest.approx(
+        PROPELLANT_INITIAL_MASS
+    )
+
+
+def test_generic_motor_keeps_thrust_source(
+    generic_motor_cesaroni_M1520, generic_motor_constant_thrust
+):
+    """Tests that the GenericMotor keeps the thrust source it was given as
+    is, instead of a converted copy.
+
+    Parameters
+    ----------
+    generic_motor_cesaroni_M1520 : rocketpy.GenericMotor
+        The GenericMotor object defined by the data points of a .eng file.
+    generic_motor_constant_thrust : rocketpy.GenericMotor
+        The GenericMotor object with a constant thrust of 1500 N.
+    """
+    assert isinstance(generic_motor_cesaroni_M1520.thrust_source, list)
+    assert generic_motor_constant_thrust.thrust_source == 1500
+
+
+def test_generic_motor_constant_thrust(generic_motor_constant_thrust):
+    """Tests the GenericMotor with a constant thrust source, whose total
+    impulse and mass flow rate are known analytically.
+
+    Parameters
+    ----------
+    generic_motor_constant_thrust : rocketpy.GenericMotor
+        The GenericMotor object with a constant thrust of 1500 N.
+    """
+    motor = generic_motor_constant_thrust
+
+    assert motor.total_impulse == 1500 * (BURN_TIME[1] - BURN_TIME[0])
+    assert motor.average_thrust == pytest.approx(1500)
+    assert motor.max_thrust == 1500
+    assert motor.thrust(4.5) == 1500
+    assert motor.thrust(BURN_TIME[1] + 1) == 0
+    assert motor.total_mass_flow_rate(4.5) == pytest.approx(
+        -PROPELLANT_INITIAL_MASS / (BURN_TIME[1] - BURN_TIME[0])
+    )
 
 
 def test_generic_motor_center_of_mass(generic_motor):
@@ -133,6 +229,38 @@ def test_generic_motor_inertia(generic_motor):
     assert generic_motor.I_33.y_array == pytest.approx(I_33)
 
 
+@pytest.mark.parametrize(
+    "attribute",
+    [
+        "propellant_I_11",
+        "propellant_I_22",
+        "propellant_I_33",
+        "I_11",
+        "I_22",
+        "I_33",
+        "I_12",
+        "I_13",
+        "I_23",
+    ],
+)
+def test_generic_motor_inertia_is_cached(generic_motor, attribute):
+    """Tests that repeated reads of the GenericMotor inertia components return
+    the same memoized Function object instead of rebuilding it.
+
+    Parameters
+    ----------
+    generic_motor : rocketpy.GenericMotor
+        The GenericMotor object to be used in the tests.
+    attribute : str
+        Name of the inertia component to be read.
+    """
+    first = getattr(generic_motor, attribute)
+
+    assert isinstance(first, Function)
+    assert getattr(generic_motor, attribute) is first
+    assert generic_motor.to_dict(include_outputs=True)[attribute] is first
+
+
 def test_load_from_eng_file(generic_motor):
     """Tests the GenericMotor.load_from_eng_file method.
 
@@ -180,3 +308,50 @@ def test_load_from_eng_file(generic_motor):
     assert generic_motor.thrust.y_array == pytest.approx(
         Function(points, "Time (s)", "Thrust (N)", "linear", "zero").y_array
     )
+
+
+def test_load_from_eng_file_reuses_parsed_file(generic_motor):
+    """Tests that loading the same .eng file twice parses it a single time,
+    while each motor still gets its own thrust curve.
+
+    Parameters
+    ----------
+    generic_motor : rocketpy.GenericMotor
+        The GenericMotor object to be used in the tests.
+    """
+    file_name = "data/motors/cesaroni/Cesaroni_M1670.eng"
+    _import_eng_cached.cache_clear()
+    with patch.object(Motor, "import_eng", wraps=Motor.import_eng) as import_eng:
+        first = generic_motor.load_from_eng_file(file_name)
+        second = generic_motor.load_from_eng_file(
+            file_name, reshape_thrust_curve=(4, 6000)
+        )
+    import_eng.assert_called_once()
+
+    assert first.thrust is not second.thrust
+    assert first.thrust_source is not second.thrust_source
+    assert first.thrust_source.flags.writeable
+    assert first.burn_time == (0, 3.9)
+    assert second.burn_time == (0, 4)
+    assert second.total_impulse == pytest.approx(6000)
+
+
+def test_load_from_eng_file_thrust_matches_linear_interpolation(generic_motor):
+    """Tests that the thrust of a motor loaded from a .eng file evaluates to
+    the linear interpolation of the file data points.
+
+    Parameters
+    ----------
+    generic_motor : rocketpy.GenericMotor
+        The GenericMotor object to be used in the tests.
+    """
+    file_name = "data/motors/cesaroni/Cesaroni_M1670.eng"
+    motor = generic_motor.load_from_eng_file(file_name)
+    _, _, points = Motor.import_eng(file_name)
+    times, thrusts = np.array(points).T
+
+    sample_times = np.linspace(0, times[-1], 97)
+    expected = np.interp(sample_times, times, thrusts)
+    evaluated = [motor.thrust.get_value_opt(t) for t in sample_times]
+    assert evaluated == pytest.approx(expected)
+    assert motor.thrust(sample_times) == pytest.approx(expected)
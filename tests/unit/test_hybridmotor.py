@@ -3,6 +3,7 @@ import pytest
 import scipy.integrate
 
 from rocketpy import Function
+from rocketpy.motors.motor import _shared_time_grid
 
 
 def thrust_function(t):
@@ -176,3 +177,44 @@ def test_hybrid_motor_inertia(hybrid_motor, spherical_oxidizer_tank):
 
         # Assert cylindrical symmetry
         assert pytest.approx(hybrid_motor.propellant_I_22(t)) == propellant_inertia(t)
+
+
+@pytest.mark.parametrize("shared_grid", [True, False])
+def test_hybrid_motor_fused_center_of_mass_and_inertia(hybrid_motor, shared_grid):
+    """Tests that the center of mass and I_11 computed on the shared time grid
+    match the Function arithmetic they replace. The propellant Functions of
+    the hybrid motor are callables, so they are sampled on a common grid to
+    take the fused path, and kept as callables to take the fallback.
+
+    Parameters
+    ----------
+    hybrid_motor : rocketpy.HybridMotor
+        The HybridMotor object to be used in the tests.
+    shared_grid : bool
+        Whether the propellant Functions are sampled on a common grid.
+    """
+    motor = hybrid_motor
+    if shared_grid:
+        motor.propellant_I_11.set_discrete(0, BURN_TIME, 50)
+        motor.propellant_mass.set_discrete(0, BURN_TIME, 50)
+        motor.center_of_propellant_mass.set_discrete(0, BURN_TIME, 50)
+    time_grid = _shared_time_grid(
+        motor.propellant_I_11, motor.propellant_mass, motor.center_of_propellant_mass
+    )
+    assert (time_grid is not None) == shared_grid
+
+    center_of_mass = (
+        motor.center_of_propellant_mass * motor.propellant_mass
+        + DRY_MASS * CENTER_OF_DRY_MASS
+    ) / motor.total_mass
+    inertia = (
+        motor.propellant_I_11
+        + motor.propellant_mass
+        * (motor.center_of_propellant_mass - center_of_mass) ** 2
+        + DRY_INERTIA[0]
+        + DRY_MASS * (CENTER_OF_DRY_MASS - center_of_mass) ** 2
+    )
+
+    times = np.linspace(0, BURN_TIME, 97)
+    assert motor.center_of_mass(times) == pytest.approx(center_of_mass(times))
+    assert motor.I_11(times) == pytest.approx(inertia(times))
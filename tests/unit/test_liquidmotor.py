@@ -2,7 +2,8 @@ import numpy as np
 import pytest
 import scipy.integrate
 
-from rocketpy import Function
+from rocketpy import Function, LiquidMotor
+from rocketpy.motors.motor import _shared_time_grid
 
 BURN_TIME = (8, 20)
 DRY_MASS = 10
@@ -73,6 +74,48 @@ def test_liquid_motor_thrust_parameters(
     assert pytest.approx(liquid_motor.total_impulse) == expected_total_impulse
 
 
+def test_liquid_motor_add_tank_resets_cached_values(
+    liquid_motor, pressurant_tank, fuel_tank, oxidizer_tank
+):
+    """Tests that adding a tank updates the cached propellant initial mass and
+    average exhaust velocity, even if they were read before.
+
+    Parameters
+    ----------
+    liquid_motor : rocketpy.LiquidMotor
+        The LiquidMotor object with all the tanks, used as reference.
+    pressurant_tank : rocketpy.Tank
+        The pressurant tank of the motor.
+    fuel_tank : rocketpy.Tank
+        The fuel tank of the motor.
+    oxidizer_tank : rocketpy.Tank
+        The oxidizer tank of the motor.
+    """
+    motor = LiquidMotor(
+        thrust_source="data/rockets/berkeley/test124_Thrust_Curve.csv",
+        burn_time=BURN_TIME,
+        dry_mass=DRY_MASS,
+        dry_inertia=DRY_INERTIA,
+        center_of_dry_mass_position=CENTER_OF_DRY_MASS,
+        nozzle_position=NOZZLE_POSITION,
+        nozzle_radius=NOZZLE_RADIUS,
+    )
+    motor.add_tank(pressurant_tank, position=PRESSURANT_TANK_POSITION)
+    motor.add_tank(fuel_tank, position=FUEL_TANK_POSITION)
+    partial_initial_mass = motor.propellant_initial_mass
+    partial_exhaust_velocity = motor._average_exhaust_velocity
+    motor.add_tank(oxidizer_tank, position=OXIDIZER_TANK_POSITION)
+
+    assert motor.propellant_initial_mass > partial_initial_mass
+    assert motor._average_exhaust_velocity < partial_exhaust_velocity
+    assert motor.propellant_initial_mass == pytest.approx(
+        liquid_motor.propellant_initial_mass
+    )
+    assert motor._average_exhaust_velocity == pytest.approx(
+        liquid_motor._average_exhaust_velocity
+    )
+
+
 def test_liquid_motor_mass_volume(
     liquid_motor,
     pressurant_fluid,
@@ -274,3 +317,41 @@ def test_liquid_motor_inertia(liquid_motor, pressurant_tank, fuel_tank, oxidizer
         pytest.approx(liquid_motor.propellant_I_22.y_array)
         == propellant_inertia.y_array
     )
+
+
+@pytest.mark.parametrize("mismatched_grid", [False, True])
+def test_liquid_motor_fused_center_of_mass_and_inertia(liquid_motor, mismatched_grid):
+    """Tests that the center of mass and I_11 computed on the shared time grid
+    match the Function arithmetic they replace. Resampling the propellant
+    center of mass on another grid forces the Function arithmetic fallback.
+
+    Parameters
+    ----------
+    liquid_motor : rocketpy.LiquidMotor
+        The LiquidMotor object to be used in the tests.
+    mismatched_grid : bool
+        Whether the propellant center of mass is resampled on another grid.
+    """
+    motor = liquid_motor
+    if mismatched_grid:
+        motor.center_of_propellant_mass.set_discrete(*BURN_TIME, 17)
+    shared_grid = _shared_time_grid(
+        motor.propellant_I_11, motor.propellant_mass, motor.center_of_propellant_mass
+    )
+    assert (shared_grid is None) == mismatched_grid
+
+    center_of_mass = (
+        motor.center_of_propellant_mass * motor.propellant_mass
+        + DRY_MASS * CENTER_OF_DRY_MASS
+    ) / motor.total_mass
+    inertia = (
+        motor.propellant_I_11
+        + motor.propellant_mass
+        * (motor.center_of_propellant_mass - center_of_mass) ** 2
+        + DRY_INERTIA[0]
+        + DRY_MASS * (CENTER_OF_DRY_MASS - center_of_mass) ** 2
+    )
+
+    times = np.linspace(*BURN_TIME, 97)
+    assert motor.center_of_mass(times) == pytest.approx(center_of_mass(times))
+    assert motor.I_11(times) == pytest.approx(inertia(times))
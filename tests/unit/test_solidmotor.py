@@ -279,3 +279,78 @@ def test_reshape_thrust_curve_asserts_resultant_thrust_curve_correct(
 
     assert thrust_reshaped[1][1] == 100 * (tuple_parametric[1] / 7539.1875)
     assert thrust_reshaped[7][1] == 2034 * (tuple_parametric[1] / 7539.1875)
+
+
+@pytest.mark.parametrize("interpolation", ["linear", "spline", "akima"])
+def test_reshape_thrust_curve_matches_total_impulse(cesaroni_m1670, interpolation):
+    """Tests that the thrust curve returned by reshape_thrust_curve spans the
+    new burn time and integrates to the requested total impulse, for each
+    interpolation method.
+
+    Parameters
+    ----------
+    cesaroni_m1670 : rocketpy.SolidMotor
+        The SolidMotor object to be used in the tests.
+    interpolation : str
+        Interpolation method of the thrust curve to be reshaped.
+    """
+    thrust = Function(
+        cesaroni_m1670.thrust.source, interpolation=interpolation, extrapolation="zero"
+    )
+    reshaped = cesaroni_m1670.reshape_thrust_curve(thrust, (1, 6), 3000)
+
+    assert reshaped.x_array[0] == pytest.approx(1)
+    assert reshaped.x_array[-1] == pytest.approx(6)
+    assert reshaped.__interpolation__ == interpolation
+    assert reshaped.integral(1, 6) == pytest.approx(3000)
+
+
+@pytest.mark.parametrize(
+    "burn_time, expected_times",
+    [
+        ((1, 3), [1, 2, 3]),
+        ((0.5, 3.5), [0.5, 1, 2, 3, 3.5]),
+        ((1.5, 1.8), [1.5, 1.8]),
+    ],
+)
+def test_clip_thrust_keeps_inner_points(cesaroni_m1670, burn_time, expected_times):
+    """Tests that clip_thrust keeps the data points strictly inside the
+    burn_time range, plus the interpolated boundary points, without
+    duplicating the points that coincide with the boundaries.
+
+    Parameters
+    ----------
+    cesaroni_m1670 : rocketpy.SolidMotor
+        The SolidMotor object to be used in the tests.
+    burn_time : tuple
+        Burn time range used to clip the thrust curve.
+    expected_times : list
+        Time samples of the clipped thrust curve.
+    """
+    thrust = Function(
+        [(0, 0), (1, 10), (2, 20), (3, 10), (4, 0)], interpolation="linear"
+    )
+    clipped = cesaroni_m1670.clip_thrust(thrust, burn_time)
+
+    assert clipped.x_array.tolist() == expected_times
+    assert clipped.y_array == pytest.approx([thrust(t) for t in expected_times])
+    assert clipped.__extrapolation__ == "zero"
+
+
+def test_clip_thrust_copies_unclipped_source(cesaroni_m1670):
+    """Tests that clip_thrust does not share the data points of the input
+    thrust when the burn_time range covers the whole thrust dataset.
+
+    Parameters
+    ----------
+    cesaroni_m1670 : rocketpy.SolidMotor
+        The SolidMotor object to be used in the tests.
+    """
+    source = np.array([(0, 0), (1, 10), (2, 20), (3, 10), (4, 0)], dtype=float)
+    thrust = Function(source, interpolation="linear", extrapolation="zero")
+    clipped = cesaroni_m1670.clip_thrust(thrust, (0, 4))
+
+    assert clipped is not thrust
+    assert np.array_equal(clipped.source, source)
+    assert not np.shares_memory(clipped.source, thrust.source)
+    assert clipped.__extrapolation__ == "zero"
@@ -1,3 +1,6 @@
+from operator import attrgetter
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
@@ -6,6 +9,9 @@ from rocketpy.tools import (
     euler313_to_quaternions,
     find_roots_cubic_function,
     haversine,
+    info_suppressed,
+    skip_if_info_suppressed,
+    suppress_info,
     tuple_handler,
 )
 
@@ -100,3 +106,56 @@ def test_tuple_handler(input_value, expected_output):
 def test_tuple_handler_exceptions(input_value, expected_exception):
     with pytest.raises(expected_exception):
         tuple_handler(input_value)
+
+
+def test_suppress_info(capsys):
+    @skip_if_info_suppressed
+    def report():
+        print("report")
+        return "done"
+
+    with suppress_info():
+        assert info_suppressed()
+        assert report() is None
+        with suppress_info():
+            assert info_suppressed()
+        assert info_suppressed()
+    assert capsys.readouterr().out == ""
+
+    assert not info_suppressed()
+    assert report() == "done"
+    assert capsys.readouterr().out == "report\n"
+
+
+@patch("matplotlib.pyplot.show")
+@pytest.mark.parametrize(
+    "report_object, method",
+    [
+        ("calisto", "all_info"),
+        ("calisto_nose_cone", "all_info"),
+        ("cesaroni_m1670", "all_info"),
+        ("generic_motor", "all_info"),
+        ("flight_calisto", "info"),
+        ("example_plain_env", "all_info"),
+        ("calisto", "prints.all"),
+        ("calisto", "plots.all"),
+        ("calisto_nose_cone", "plots.all"),
+        ("cesaroni_m1670", "plots.all"),
+    ],
+)
+def test_suppress_info_reports(mock_show, report_object, method, request, capsys):
+    report_object = request.getfixturevalue(report_object)
+    capsys.readouterr()
+
+    with suppress_info():
+        assert attrgetter(method)(report_object)() is None
+    assert capsys.readouterr().out == ""
+    mock_show.assert_not_called()
+
+
+def test_suppress_info_saves_requested_file(cesaroni_m1670, tmp_path):
+    filename = tmp_path / "thrust.png"
+
+    with suppress_info():
+        cesaroni_m1670.info(filename=str(filename))
+    assert filename.exists()